@@ -0,0 +1,41 @@
+"""Add keyset pagination indexes
+
+Revision ID: 52bd03da3f17
+Revises: c20f6f6fce27
+Create Date: 2026-10-18 10:03:17.284106
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '52bd03da3f17'
+down_revision: Union[str, Sequence[str], None] = 'c20f6f6fce27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Listings page by (created_at, id), optionally behind an equality filter
+INDEXES = [
+    ('ix_tickets_created_at_id', 'tickets', ['created_at', 'id']),
+    ('ix_tickets_project_id_created_at_id', 'tickets', ['project_id', 'created_at', 'id']),
+    ('ix_sprints_created_at_id', 'sprints', ['created_at', 'id']),
+    ('ix_projects_owner_id_created_at_id', 'projects', ['owner_id', 'created_at', 'id']),
+    ('ix_users_created_at_id', 'users', ['created_at', 'id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
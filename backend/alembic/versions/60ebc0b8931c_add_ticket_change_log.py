@@ -0,0 +1,44 @@
+"""Add ticket change log
+
+Revision ID: 60ebc0b8931c
+Revises: 6ccd427cc7c7
+Create Date: 2026-10-18 12:02:17.418263
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '60ebc0b8931c'
+down_revision: Union[str, Sequence[str], None] = '6ccd427cc7c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('projects', sa.Column('change_counter', sa.Integer(), server_default='0', nullable=False))
+    op.create_table('ticket_changes',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('project_id', sa.UUID(), nullable=False),
+    sa.Column('seq', sa.Integer(), nullable=False),
+    sa.Column('ticket_id', sa.UUID(), nullable=False),
+    sa.Column('op', sa.Enum('CREATED', 'UPDATED', 'DELETED', name='ticketchangeop'), nullable=False),
+    sa.Column('data', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('project_id', 'seq', name='uq_ticket_changes_project_id_seq')
+    )
+    op.create_index(op.f('ix_ticket_changes_id'), 'ticket_changes', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_ticket_changes_id'), table_name='ticket_changes')
+    op.drop_table('ticket_changes')
+    sa.Enum(name='ticketchangeop').drop(op.get_bind(), checkfirst=True)
+    op.drop_column('projects', 'change_counter')
@@ -0,0 +1,39 @@
+"""Add standup config next fire time
+
+Revision ID: 6a3eef5ca3da
+Revises: f0ab819554d8
+Create Date: 2026-10-18 14:05:12.330871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a3eef5ca3da'
+down_revision: Union[str, Sequence[str], None] = 'f0ab819554d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Left null here; the scheduler fills it in for existing configs on its next tick
+    op.add_column('standup_configs', sa.Column('next_fire_at', sa.DateTime(), nullable=True))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_standup_configs_is_active_next_fire_at', 'standup_configs', ['is_active', 'next_fire_at'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_standup_configs_is_active_next_fire_at', table_name='standup_configs',
+            postgresql_concurrently=True, if_exists=True,
+        )
+    op.drop_column('standup_configs', 'next_fire_at')
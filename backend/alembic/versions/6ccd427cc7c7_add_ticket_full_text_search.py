@@ -0,0 +1,44 @@
+"""Add ticket full-text search
+
+Revision ID: 6ccd427cc7c7
+Revises: 6fcce34b6ac1
+Create Date: 2026-10-18 11:20:05.671442
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6ccd427cc7c7'
+down_revision: Union[str, Sequence[str], None] = '6fcce34b6ac1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Stored generated column: Postgres keeps it current on every insert/update,
+    # including bulk statements, so the app never writes it.
+    op.execute(
+        """
+        ALTER TABLE tickets ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        ) STORED
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tickets_search_vector', 'tickets', ['search_vector'],
+            postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tickets_search_vector', table_name='tickets', postgresql_concurrently=True, if_exists=True)
+    op.drop_column('tickets', 'search_vector')
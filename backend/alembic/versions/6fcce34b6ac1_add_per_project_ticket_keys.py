@@ -0,0 +1,83 @@
+"""Add per-project ticket keys
+
+Revision ID: 6fcce34b6ac1
+Revises: 52bd03da3f17
+Create Date: 2026-10-18 10:41:52.910337
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6fcce34b6ac1'
+down_revision: Union[str, Sequence[str], None] = '52bd03da3f17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _project_key(name):
+    """TicketService.derive_project_key as of this revision: initials for multi-word names, else the first letters."""
+    words = re.findall(r'[A-Za-z0-9]+', name or "")
+    if len(words) > 1:
+        key = "".join(w[0] for w in words)[:4]
+    else:
+        key = (words[0] if words else "")[:4]
+    key = key.upper()
+    if not key or not key[0].isalpha():
+        key = "P" + key
+    return key[:10]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('projects', sa.Column('key', sa.String(length=10), nullable=True))
+    op.add_column('projects', sa.Column('ticket_counter', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('tickets', sa.Column('number', sa.Integer(), nullable=True))
+    op.add_column('tickets', sa.Column('key', sa.String(length=32), nullable=True))
+
+    # Backfill project keys the way new projects get theirs
+    projects = sa.table('projects', sa.column('id'), sa.column('name'), sa.column('key'))
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(projects.c.id, projects.c.name)).all()
+    if rows:
+        bind.execute(
+            projects.update().where(projects.c.id == sa.bindparam('project_id')).values(key=sa.bindparam('new_key')),
+            [{'project_id': row.id, 'new_key': _project_key(row.name)} for row in rows],
+        )
+
+    # Number existing tickets in creation order within each project
+    op.execute(
+        """
+        UPDATE tickets SET number = numbered.rn, key = projects.key || '-' || numbered.rn
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY project_id ORDER BY created_at, id) AS rn
+            FROM tickets
+        ) AS numbered, projects
+        WHERE tickets.id = numbered.id AND projects.id = tickets.project_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE projects SET ticket_counter = counts.max_number
+        FROM (SELECT project_id, max(number) AS max_number FROM tickets GROUP BY project_id) AS counts
+        WHERE projects.id = counts.project_id
+        """
+    )
+
+    op.alter_column('projects', 'key', nullable=False)
+    op.alter_column('tickets', 'number', nullable=False)
+    op.alter_column('tickets', 'key', nullable=False)
+    op.create_unique_constraint('uq_tickets_project_id_key', 'tickets', ['project_id', 'key'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_tickets_project_id_key', 'tickets', type_='unique')
+    op.drop_column('tickets', 'key')
+    op.drop_column('tickets', 'number')
+    op.drop_column('projects', 'ticket_counter')
+    op.drop_column('projects', 'key')
@@ -0,0 +1,47 @@
+"""Add response jobs
+
+Revision ID: abf6a88c21ea
+Revises: 6a3eef5ca3da
+Create Date: 2026-10-18 15:41:06.207315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'abf6a88c21ea'
+down_revision: Union[str, Sequence[str], None] = '6a3eef5ca3da'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('response_jobs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('response_id', sa.UUID(), nullable=False),
+    sa.Column('session_id', sa.UUID(), nullable=False),
+    sa.Column('status', sa.Enum('QUEUED', 'RUNNING', 'DONE', 'FAILED', name='jobstatus'), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('run_after', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['response_id'], ['standup_responses.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_response_jobs_id'), 'response_jobs', ['id'], unique=False)
+    op.create_index(op.f('ix_response_jobs_response_id'), 'response_jobs', ['response_id'], unique=False)
+    op.create_index('ix_response_jobs_status_run_after', 'response_jobs', ['status', 'run_after'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_response_jobs_status_run_after', table_name='response_jobs')
+    op.drop_index(op.f('ix_response_jobs_response_id'), table_name='response_jobs')
+    op.drop_index(op.f('ix_response_jobs_id'), table_name='response_jobs')
+    op.drop_table('response_jobs')
+    sa.Enum(name='jobstatus').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,70 @@
+"""Add performance indexes for hot query patterns
+
+Revision ID: c20f6f6fce27
+Revises: 58db9f6c147b
+Create Date: 2026-10-18 09:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c20f6f6fce27'
+down_revision: Union[str, Sequence[str], None] = '58db9f6c147b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns). project_members(project_id, user_id) is already
+# covered by the uq_project_user constraint index.
+INDEXES = [
+    ('ix_tickets_project_id_status', 'tickets', ['project_id', 'status']),
+    ('ix_tickets_sprint_id', 'tickets', ['sprint_id']),
+    ('ix_sprints_project_id_status', 'sprints', ['project_id', 'status']),
+    ('ix_projects_owner_id', 'projects', ['owner_id']),
+    ('ix_standup_configs_project_id', 'standup_configs', ['project_id']),
+    ('ix_standup_sessions_project_id_status', 'standup_sessions', ['project_id', 'status']),
+    ('ix_standup_sessions_project_id_created_at', 'standup_sessions', ['project_id', 'created_at']),
+    ('ix_standup_sessions_config_id_started_at', 'standup_sessions', ['config_id', 'started_at']),
+    ('ix_standup_sessions_status_ends_at', 'standup_sessions', ['status', 'ends_at']),
+    ('ix_standup_summaries_session_id', 'standup_summaries', ['session_id']),
+    ('ix_ai_epics_project_id', 'ai_epics', ['project_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep only the latest response per (session, user) so the unique index can be built
+    op.execute(
+        """
+        DELETE FROM standup_responses a
+        USING standup_responses b
+        WHERE a.session_id = b.session_id
+          AND a.user_id = b.user_id
+          AND (a.created_at < b.created_at OR (a.created_at = b.created_at AND a.id < b.id))
+        """
+    )
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(
+            'uq_standup_response_session_user', 'standup_responses', ['session_id', 'user_id'],
+            unique=True, postgresql_concurrently=True, if_not_exists=True,
+        )
+
+    op.execute(
+        'ALTER TABLE standup_responses ADD CONSTRAINT uq_standup_response_session_user '
+        'UNIQUE USING INDEX uq_standup_response_session_user'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_standup_response_session_user', 'standup_responses', type_='unique')
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,39 @@
+"""Add sprint snapshots
+
+Revision ID: f0ab819554d8
+Revises: 60ebc0b8931c
+Create Date: 2026-10-18 13:20:44.902117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f0ab819554d8'
+down_revision: Union[str, Sequence[str], None] = '60ebc0b8931c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('sprint_snapshots',
+    sa.Column('sprint_id', sa.UUID(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('committed_points', sa.Integer(), nullable=False),
+    sa.Column('completed_points', sa.Integer(), nullable=False),
+    sa.Column('remaining_points', sa.Integer(), nullable=False),
+    sa.Column('ticket_count', sa.Integer(), nullable=False),
+    sa.Column('done_count', sa.Integer(), nullable=False),
+    sa.Column('recorded_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['sprint_id'], ['sprints.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('sprint_id', 'day')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('sprint_snapshots')
@@ -1,14 +1,19 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from pydantic import ValidationError
 
 from app.core import security
 from app.core.config import settings
-from app.database import SessionLocal
+from app.core.principal_cache import principal_cache
+from app.database import SessionLocal, AsyncSessionLocal, ReplicaSessionLocal, AsyncReplicaSessionLocal
+from app.db.replica import should_read_primary
 from app.models.user import User
 from app.schemas.token import TokenData
+from app.schemas.user import User as UserSnapshot
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
@@ -19,9 +24,44 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def get_read_db(request: Request):
+    """Session for read-only routes: the replica, unless this client just wrote."""
+    factory = SessionLocal if should_read_primary(request) else ReplicaSessionLocal
+    db = factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_read_db(request: Request):
+    factory = AsyncSessionLocal if should_read_primary(request) else AsyncReplicaSessionLocal
+    async with factory() as db:
+        yield db
+
 def get_current_user(
     db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> User:
+) -> UserSnapshot:
+    return get_user_for_token(db, token)
+
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(oauth2_scheme)
+) -> UserSnapshot:
+    """get_current_user for async routes: a cache miss awaits the lookup instead of using a worker thread."""
+    subject = _token_subject(token)
+    cached = principal_cache.get(subject)
+    if cached is not None:
+        return cached
+    result = await db.execute(select(User).where(User.email == subject).limit(1))
+    user = result.scalars().first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return principal_cache.set(subject, user)
+
+def _token_subject(token: str) -> str:
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
@@ -32,14 +72,35 @@ def get_current_user(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"Could not validate credentials: {str(e)}",
         )
-    user = db.query(User).filter(User.email == token_data.sub).first()
+    return token_data.sub
+
+def get_user_for_token(db: Session, token: str) -> UserSnapshot:
+    subject = _token_subject(token)
+    cached = principal_cache.get(subject)
+    if cached is not None:
+        return cached
+    user = db.query(User).filter(User.email == subject).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return user
+    return principal_cache.set(subject, user)
 
 def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: UserSnapshot = Depends(get_current_user),
+) -> UserSnapshot:
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
+async def get_current_active_user_async(
+    current_user: UserSnapshot = Depends(get_current_user_async),
+) -> UserSnapshot:
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
+
+def get_current_active_superuser(
+    current_user: UserSnapshot = Depends(get_current_active_user),
+) -> UserSnapshot:
+    if not current_user.is_superuser:
+        raise HTTPException(status_code=403, detail="The user doesn't have enough privileges")
+    return current_user
@@ -0,0 +1,41 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, Response
+from sqlalchemy import tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    raw = json.dumps({"c": created_at.isoformat(), "i": str(id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        return datetime.fromisoformat(data["c"]), UUID(data["i"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def paginate(query: Any, model: Any, cursor: Optional[str], skip: int, limit: int) -> Any:
+    """
+    Order a Query/Select by (created_at, id) and apply keyset pagination.
+    Without a cursor, skip falls back to legacy offset paging.
+    """
+    query = query.order_by(model.created_at, model.id)
+    if cursor:
+        created_at, id = decode_cursor(cursor)
+        query = query.filter(tuple_(model.created_at, model.id) > tuple_(created_at, id))
+    elif skip:
+        query = query.offset(skip)
+    return query.limit(limit)
+
+def set_next_cursor(response: Response, items: Sequence[Any], limit: int) -> None:
+    """Advertise the cursor for the next page when this one came back full."""
+    if items and len(items) == limit:
+        last = items[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
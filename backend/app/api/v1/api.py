@@ -1,6 +1,10 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from app.routes import auth, users, projects, sprints, tickets, standups, settings, ai, reports, uploads, project_team, ai_agent
+from app.api import deps
+from app.core.singleflight import get_coalescing_stats
+from app.database import get_pool_status
+from app.services.scheduler import leader as scheduler_leader
+from app.routes import auth, users, projects, sprints, tickets, standups, settings, ai, reports, uploads, project_team, ai_agent, realtime
 
 api_router = APIRouter()
 
@@ -8,6 +12,20 @@ api_router = APIRouter()
 def health_check():
     return {"status": "ok"}
 
+# Diagnostics expose pool internals, pids and leader state: superusers only.
+# Plain /health stays open for load balancers.
+@api_router.get("/health/db", tags=["status"], dependencies=[Depends(deps.get_current_active_superuser)])
+def database_pool_status():
+    return get_pool_status()
+
+@api_router.get("/health/coalescing", tags=["status"], dependencies=[Depends(deps.get_current_active_superuser)])
+def request_coalescing_status():
+    return get_coalescing_stats()
+
+@api_router.get("/health/scheduler", tags=["status"], dependencies=[Depends(deps.get_current_active_superuser)])
+def scheduler_status():
+    return scheduler_leader.status()
+
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(projects.router, prefix="/projects", tags=["projects"])
@@ -20,3 +38,4 @@ api_router.include_router(ai.router, prefix="/ai", tags=["ai-legacy"])
 api_router.include_router(ai_agent.router, prefix="/ai", tags=["ai-agent"])
 api_router.include_router(reports.router, prefix="/reports", tags=["reports"])
 api_router.include_router(uploads.router, prefix="/uploads", tags=["uploads"])
+api_router.include_router(realtime.router, prefix="/realtime", tags=["realtime"])
@@ -12,11 +12,63 @@ class Settings(BaseSettings):
     POSTGRES_DB: Optional[str] = None
     SQLALCHEMY_DATABASE_URI: Optional[str] = None
 
+    # Optional read replica for read-only routes. Clients that wrote within the
+    # last REPLICA_READ_YOUR_WRITES_SECONDS keep reading from the primary.
+    SQLALCHEMY_REPLICA_URI: Optional[str] = None
+    REPLICA_READ_YOUR_WRITES_SECONDS: int = 10
+
+    # Connection pool. With DB_POOL_PRE_PING disabled, stale connections are
+    # instead handled by DB_POOL_RECYCLE and SQLAlchemy's disconnect invalidation.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
     # JWT configuration
     SECRET_KEY: str = "YOUR_SUPER_SECRET_KEY_HERE_CHANGE_IN_PRODUCTION"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Authenticated principal cache (set TTL to 0 to disable)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+
+    # Per-project dashboard metrics cache (set TTL to 0 to disable)
+    METRICS_CACHE_TTL_SECONDS: int = 30
+    METRICS_CACHE_MAX_PROJECTS: int = 10000
+
+    # Real-time project event streams: events buffered per WebSocket client
+    # before it is told to resync from the ticket change feed
+    REALTIME_QUEUE_SIZE: int = 100
+
+    # Standup summary generation after sessions close: worker threads, time
+    # allowed per AI call, and attempts per session before backing off for an hour
+    STANDUP_SUMMARY_MAX_WORKERS: int = 4
+    STANDUP_SUMMARY_TIMEOUT_SECONDS: int = 60
+    STANDUP_SUMMARY_MAX_ATTEMPTS: int = 3
+
+    # Only one process runs the scheduler's jobs. Others retry the leader lock
+    # this often, which bounds how long jobs pause when the leader dies.
+    SCHEDULER_LEADER_RETRY_SECONDS: float = 15
+
+    # Set to false when background work runs in a separate `python -m app.worker`
+    # process: API processes then skip the scheduler and, with the database
+    # response queue, only enqueue jobs
+    RUN_SCHEDULER_IN_APP: bool = True
+
+    # Background processing of standup responses. "memory" queues in-process;
+    # "database" keeps jobs in response_jobs so they survive restarts.
+    RESPONSE_QUEUE_MODE: str = "memory"
+    RESPONSE_QUEUE_BATCH_SIZE: int = 200
+    RESPONSE_QUEUE_MAX_ATTEMPTS: int = 5
+    RESPONSE_QUEUE_POLL_SECONDS: float = 2.0
+
+    # Password hashing (bcrypt cost and dedicated worker pool limits)
+    PASSWORD_HASH_ROUNDS: int = 12
+    PASSWORD_HASH_MAX_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+
     class Config:
         case_sensitive = True
         env_file = ".env"
@@ -0,0 +1,50 @@
+from typing import Optional
+
+from sqlalchemy import inspect
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.db.events import ALL, on_committed_writes
+from app.models.user import User
+from app.schemas.user import User as UserSnapshot
+
+
+class PrincipalCache(TTLCache):
+    """
+    Bounded, TTL-evicting cache of authenticated user snapshots keyed by JWT subject.
+
+    The token itself is still verified on every request; the cache only saves the
+    users lookup that follows it. Entries are plain schema objects, never ORM
+    instances, so they are safe to share across sessions and threads.
+    """
+
+    def get(self, subject: str) -> Optional[UserSnapshot]:
+        return super().get(subject)
+
+    def set(self, subject: str, user: User) -> UserSnapshot:
+        return super().set(subject, UserSnapshot.model_validate(user))
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+)
+
+
+def _emails(session, user: User):
+    # Read at flush time, while the history still has any previous email
+    return (user.email, *(inspect(user).attrs.email.history.deleted or ()))
+
+
+@on_committed_writes((User,), key=_emails)
+def _invalidate_users(changed) -> None:
+    # Only after commit: dropped at flush time, a concurrent request could read
+    # the old row before the commit and cache it again for a whole TTL.
+    # Drop both the current and any previous email so renamed users can't
+    # keep authenticating against a stale snapshot.
+    if ALL in changed:
+        principal_cache.clear()
+        return
+    for emails in changed:
+        for email in emails:
+            principal_cache.invalidate(email)
@@ -1,17 +1,72 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.PASSWORD_HASH_ROUNDS,
+    # Pin the bounds too so a changed cost in either direction flags stored hashes for rehash
+    bcrypt__min_rounds=settings.PASSWORD_HASH_ROUNDS,
+    bcrypt__max_rounds=settings.PASSWORD_HASH_ROUNDS,
+)
+
+# Stored for accounts that must not be able to log in with a password (e.g. invited
+# users who haven't set one yet). It never matches a bcrypt hash, so no hashing is needed.
+UNUSABLE_PASSWORD = "!"
+
+# bcrypt gets its own bounded pool so a burst of logins can't starve the shared
+# AnyIO thread pool that every sync route runs in.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_MAX_WORKERS, thread_name_prefix="password-hash"
+)
+_hash_slots = threading.BoundedSemaphore(
+    settings.PASSWORD_HASH_MAX_WORKERS + settings.PASSWORD_HASH_MAX_QUEUE
+)
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing pool already has its maximum number of queued jobs."""
+
+def is_password_usable(hashed_password: Optional[str]) -> bool:
+    return bool(hashed_password) and not hashed_password.startswith(UNUSABLE_PASSWORD)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
+    if not is_password_usable(hashed_password):
+        return False
     return pwd_context.verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+def _verify_and_update(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    if not is_password_usable(hashed_password):
+        return False, None
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+async def _run_in_hash_pool(fn, *args):
+    if not _hash_slots.acquire(blocking=False):
+        raise PasswordHasherBusy()
+    future = _hash_executor.submit(fn, *args)
+    # Release on completion rather than on await so cancelled requests keep
+    # their slot until the bcrypt work they queued has actually finished.
+    future.add_done_callback(lambda _: _hash_slots.release())
+    return await asyncio.wrap_future(future)
+
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password in the hashing pool.
+    Returns (verified, new_hash); new_hash is set when the stored hash uses
+    outdated settings (e.g. a lower PASSWORD_HASH_ROUNDS) and should be saved.
+    """
+    return await _run_in_hash_pool(_verify_and_update, plain_password, hashed_password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -0,0 +1,111 @@
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable
+
+# Every SingleFlight registers here so /health/coalescing can report on it
+_flights: Dict[str, "SingleFlight"] = {}
+
+
+class _LeaderCancelled(Exception):
+    """The caller running the shared computation went away; waiters retry."""
+
+
+class SingleFlight:
+    """
+    Lets concurrent callers with the same key share one in-flight computation.
+
+    Only calls that overlap are coalesced: the entry is dropped as soon as the
+    computation finishes, so nothing is served after it completes. `forget()`
+    detaches an in-flight entry early (e.g. after a committed write) so callers
+    arriving afterwards start a fresh computation instead of joining one that
+    began before the write.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        _flights[name] = self
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self.calls += 1
+        while True:
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                self.coalesced -= 1
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.executions += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            self._settle(future, exc=_LeaderCancelled())
+            raise
+        except Exception as exc:
+            self._settle(future, exc=exc)
+            raise
+        else:
+            self._settle(future, result=result)
+            return result
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    @staticmethod
+    def _settle(future: asyncio.Future, result: Any = None, exc: BaseException = None) -> None:
+        if exc is None:
+            future.set_result(result)
+            return
+        future.set_exception(exc)
+        # The leader re-raises it itself; don't warn when nobody was waiting
+        future.exception()
+
+    def forget(self, key: Hashable) -> None:
+        self._inflight.pop(key, None)
+
+    def forget_many(self, keys: Iterable[Hashable]) -> None:
+        for key in keys:
+            # None is on_committed_writes' ALL: the writes can't be narrowed down
+            if key is None:
+                self._inflight.clear()
+                return
+            self.forget(key)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+        }
+
+
+def coalesce(name: str, key: Callable[..., Hashable]):
+    """
+    Route decorator: concurrent requests whose `key(**path_and_query_params)`
+    match share one execution of the endpoint. Only use it on endpoints whose
+    response doesn't depend on the caller.
+    """
+    flight = SingleFlight(name)
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            return await flight.do(key(**kwargs), lambda: fn(*args, **kwargs))
+
+        wrapper.flight = flight
+        return wrapper
+
+    return decorator
+
+
+def get_coalescing_stats() -> Dict[str, Dict[str, int]]:
+    return {name: flight.stats() for name, flight in _flights.items()}
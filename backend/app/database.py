@@ -1,7 +1,71 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.db.pool import PoolStats, pool_options, track_invalidations
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, pool_pre_ping=True)
+pool_stats = {
+    "sync": PoolStats(),
+    "async": PoolStats(),
+    "replica": PoolStats(),
+    "async_replica": PoolStats(),
+}
+
+engine = create_engine(
+    settings.SQLALCHEMY_DATABASE_URI,
+    **pool_options(settings.SQLALCHEMY_DATABASE_URI, pool_stats["sync"]),
+)
+track_invalidations(engine.pool, pool_stats["sync"])
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def get_async_database_uri(uri: str) -> str:
+    """Rewrite a sync database URL for its async driver (asyncpg / aiosqlite)."""
+    url = make_url(uri)
+    backend = url.get_backend_name()
+    if backend in ("postgresql", "postgres"):
+        query = dict(url.query)
+        # libpq-only options that asyncpg rejects (common in Neon/Render URLs)
+        sslmode = query.pop("sslmode", None)
+        query.pop("channel_binding", None)
+        if sslmode and "ssl" not in query:
+            query["ssl"] = sslmode
+        url = url.set(drivername="postgresql+asyncpg", query=query)
+    elif backend == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url.render_as_string(hide_password=False)
+
+ASYNC_DATABASE_URI = get_async_database_uri(settings.SQLALCHEMY_DATABASE_URI)
+async_engine = create_async_engine(ASYNC_DATABASE_URI, **pool_options(ASYNC_DATABASE_URI, pool_stats["async"]))
+track_invalidations(async_engine.pool, pool_stats["async"])
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+# Optional read replica. Without one, read sessions simply use the primary.
+replica_engine = None
+async_replica_engine = None
+if settings.SQLALCHEMY_REPLICA_URI:
+    replica_engine = create_engine(
+        settings.SQLALCHEMY_REPLICA_URI,
+        **pool_options(settings.SQLALCHEMY_REPLICA_URI, pool_stats["replica"]),
+    )
+    track_invalidations(replica_engine.pool, pool_stats["replica"])
+    ASYNC_REPLICA_URI = get_async_database_uri(settings.SQLALCHEMY_REPLICA_URI)
+    async_replica_engine = create_async_engine(ASYNC_REPLICA_URI, **pool_options(ASYNC_REPLICA_URI, pool_stats["async_replica"]))
+    track_invalidations(async_replica_engine.pool, pool_stats["async_replica"])
+
+ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine or engine)
+AsyncReplicaSessionLocal = async_sessionmaker(
+    async_replica_engine or async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+def get_pool_status() -> dict:
+    """Live gauges and checkout counters for every engine's connection pool."""
+    status = {
+        "sync": pool_stats["sync"].snapshot(engine.pool),
+        "async": pool_stats["async"].snapshot(async_engine.pool),
+    }
+    if replica_engine is not None:
+        status["replica"] = pool_stats["replica"].snapshot(replica_engine.pool)
+        status["async_replica"] = pool_stats["async_replica"].snapshot(async_replica_engine.pool)
+    return status
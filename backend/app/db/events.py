@@ -0,0 +1,52 @@
+from typing import Any, Callable, Optional, Set, Tuple, Type
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Passed to callbacks when a bulk statement touched the model and the affected
+# keys can't be known without another query; treat it as "everything changed".
+ALL = None
+
+
+def on_committed_writes(
+    models: Tuple[Type, ...],
+    key: Callable[[Session, Any], Any] = lambda session, obj: ALL,
+):
+    """
+    Register a callback that runs after a commit that wrote any of `models`.
+
+    `key(session, obj)` is evaluated at flush time (while attributes are still
+    loaded) and the callback receives the set of keys that changed. Bulk
+    ORM statements (insert/update/delete on the model) contribute ALL.
+    Rolled-back writes never reach the callback.
+    """
+
+    def decorator(fn: Callable[[Set[Optional[Any]]], None]):
+        info_key = f"committed_writes:{fn.__module__}.{fn.__qualname__}"
+
+        @event.listens_for(Session, "after_flush")
+        def _collect_flushed(session, flush_context):
+            for obj in (*session.new, *session.dirty, *session.deleted):
+                if isinstance(obj, models):
+                    session.info.setdefault(info_key, set()).add(key(session, obj))
+
+        @event.listens_for(Session, "do_orm_execute")
+        def _collect_bulk(orm_execute_state):
+            if not orm_execute_state.is_select and any(
+                m.class_ in models for m in orm_execute_state.all_mappers
+            ):
+                orm_execute_state.session.info.setdefault(info_key, set()).add(ALL)
+
+        @event.listens_for(Session, "after_commit")
+        def _dispatch(session):
+            keys = session.info.pop(info_key, None)
+            if keys:
+                fn(keys)
+
+        @event.listens_for(Session, "after_rollback")
+        def _discard(session):
+            session.info.pop(info_key, None)
+
+        return fn
+
+    return decorator
@@ -0,0 +1,172 @@
+import logging
+import os
+import tempfile
+import threading
+from typing import Callable, Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class _AdvisoryLock:
+    """Session-level pg advisory lock held on a dedicated connection; Postgres frees it if we die."""
+
+    def __init__(self, url: str, key: int):
+        self.key = key
+        # Outside the pool: the leader holds this connection for as long as it leads
+        self._engine = create_engine(url, poolclass=NullPool, isolation_level="AUTOCOMMIT")
+        self._conn = None
+
+    def acquire(self) -> bool:
+        conn = self._engine.connect()
+        if conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": self.key}).scalar():
+            self._conn = conn
+            return True
+        conn.close()
+        return False
+
+    def check(self) -> bool:
+        try:
+            self._conn.execute(text("SELECT 1"))
+            return True
+        except Exception as e:
+            logger.warning(f"Lost leader lock connection: {e}")
+            return False
+
+    def release(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.key})
+        except Exception:
+            pass  # Connection is gone, and the lock with it
+        finally:
+            conn.close()
+
+
+class _FileLock:
+    """flock on a file next to the SQLite database; the OS frees it if we die."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def acquire(self) -> bool:
+        if fcntl is None:
+            # No flock here: a single-process dev setup is the only sensible one
+            return True
+        f = open(self.path, "a")
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            f.close()
+            return False
+        self._file = f
+        return True
+
+    def check(self) -> bool:
+        return True
+
+    def release(self) -> None:
+        f, self._file = self._file, None
+        if f is not None:
+            fcntl.flock(f, fcntl.LOCK_UN)
+            f.close()
+
+
+def _lock_file_path(url: str, name: str) -> str:
+    database = make_url(url).database
+    if database and database != ":memory:":
+        return f"{os.path.abspath(database)}.{name}.lock"
+    return os.path.join(tempfile.gettempdir(), f"tickora.{name}.lock")
+
+
+class LeaderElection:
+    """
+    Elects one process, out of every process sharing the database, to run
+    work that must not run concurrently (the scheduler's jobs).
+
+    On Postgres the leader holds an advisory lock on its own connection; on
+    SQLite it holds a file lock. Either is released when the leader exits or
+    dies, and the other processes, retrying every `retry_seconds`, take over.
+    The leader checks its connection on the same interval and steps down if it
+    is lost, since Postgres will have released the lock with it.
+
+    `on_deposed` must only return once the work has stopped: the lock is
+    released right after it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        key: int,
+        on_elected: Callable[[], None],
+        on_deposed: Callable[[], None],
+        retry_seconds: float,
+        url: str = settings.SQLALCHEMY_DATABASE_URI,
+    ):
+        self.name = name
+        self.on_elected = on_elected
+        self.on_deposed = on_deposed
+        self.retry_seconds = retry_seconds
+        if make_url(url).get_backend_name() in ("postgresql", "postgres"):
+            self._lock = _AdvisoryLock(url, key)
+        else:
+            self._lock = _FileLock(_lock_file_path(url, name))
+        self.is_leader = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"{self.name}-leader", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if not self.is_leader and self._lock.acquire():
+                    self.is_leader = True
+                    logger.info(f"This process is now the {self.name} leader")
+                    self.on_elected()
+                elif self.is_leader and not self._lock.check():
+                    self._step_down()
+            except Exception as e:
+                logger.error(f"Error in {self.name} leader election: {e}")
+                if self.is_leader:
+                    self._step_down()
+            self._stop.wait(self.retry_seconds)
+
+        if self.is_leader:
+            self._step_down()
+
+    def _step_down(self) -> None:
+        self.is_leader = False
+        logger.info(f"This process is no longer the {self.name} leader")
+        try:
+            # Stop the work before letting another process take over
+            self.on_deposed()
+        finally:
+            self._lock.release()
+
+    def status(self) -> dict:
+        return {"name": self.name, "is_leader": self.is_leader, "pid": os.getpid()}
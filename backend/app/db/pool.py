@@ -0,0 +1,105 @@
+import logging
+import threading
+import time
+from typing import Any, Dict, Type
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import Pool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PoolStats:
+    """Counters for connection checkouts on one engine's pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.timeouts = 0
+        self.invalidations = 0
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def record_invalidation(self) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        with self._lock:
+            avg = self.wait_total / self.checkouts if self.checkouts else 0.0
+            counters = {
+                "checkouts": self.checkouts,
+                "wait_ms_avg": round(avg * 1000, 3),
+                "wait_ms_max": round(self.wait_max * 1000, 3),
+                "timeouts": self.timeouts,
+                "invalidations": self.invalidations,
+            }
+        # QueuePool exposes live gauges; other pool types (e.g. SQLite's) don't
+        gauges = {}
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            fn = getattr(pool, name, None)
+            if callable(fn):
+                gauges[name] = fn()
+        return {"pool": type(pool).__name__, **gauges, **counters}
+
+
+def instrument_pool_class(base: Type[Pool], stats: PoolStats) -> Type[Pool]:
+    """
+    Subclass a pool so every checkout records how long it waited.
+    Pool.recreate() keeps the class, so stats survive engine.dispose().
+    """
+
+    class InstrumentedPool(base):
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                conn = super()._do_get()
+            except exc.TimeoutError:
+                stats.record_timeout()
+                logger.warning("Connection pool exhausted: %s", self.status())
+                raise
+            stats.record_wait(time.perf_counter() - start)
+            return conn
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
+
+
+def pool_options(uri: str, stats: PoolStats) -> Dict[str, Any]:
+    """Engine keyword arguments for the configured pooling strategy."""
+    url = make_url(uri)
+    base = url.get_dialect().get_pool_class(url)
+    options: Dict[str, Any] = {
+        "poolclass": instrument_pool_class(base, stats),
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    # SQLite uses its own pool classes that don't take sizing arguments
+    if url.get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+    return options
+
+
+def track_invalidations(pool: Pool, stats: PoolStats) -> None:
+    """Count connections discarded after disconnect errors (carried over by Pool.recreate)."""
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        stats.record_invalidation()
@@ -0,0 +1,52 @@
+import time
+from typing import Optional
+
+from fastapi import Request
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+# Set on responses to successful writes so any worker can send that client's
+# reads to the primary until replication has caught up.
+READ_PRIMARY_COOKIE = "read_primary_until"
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Bearer tokens that wrote within the read-your-writes window
+recent_writers = TTLCache(settings.REPLICA_READ_YOUR_WRITES_SECONDS, max_entries=10000)
+
+
+def _bearer_token(request: Request) -> Optional[str]:
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    return token if scheme.lower() == "bearer" and token else None
+
+
+def should_read_primary(request: Request) -> bool:
+    """True if this client wrote recently enough that the replica may be behind."""
+    until = request.cookies.get(READ_PRIMARY_COOKIE)
+    if until:
+        try:
+            if float(until) > time.time():
+                return True
+        except ValueError:
+            pass
+    token = _bearer_token(request)
+    return bool(token and recent_writers.get(token))
+
+
+async def read_your_writes_middleware(request: Request, call_next):
+    response = await call_next(request)
+    if request.method not in SAFE_METHODS and response.status_code < 400:
+        window = settings.REPLICA_READ_YOUR_WRITES_SECONDS
+        token = _bearer_token(request)
+        if token:
+            recent_writers.set(token, True)
+        response.set_cookie(
+            READ_PRIMARY_COOKIE,
+            str(time.time() + window),
+            max_age=window,
+            httponly=True,
+            secure=True,
+            samesite="none",
+        )
+    return response
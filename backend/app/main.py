@@ -4,14 +4,24 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
 from app.api.v1.api import api_router
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.db.replica import read_your_writes_middleware
+from app.services.realtime_service import realtime_service
+from app.services.response_queue import response_queue
 from app.services.scheduler import start_scheduler, stop_scheduler
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: Start the scheduler
-    start_scheduler()
+    # Startup: Start the scheduler, unless a separate worker process runs it
+    if settings.RUN_SCHEDULER_IN_APP:
+        start_scheduler()
+    await realtime_service.start()
+    if settings.RUN_SCHEDULER_IN_APP or not response_queue.durable:
+        response_queue.start()
     yield
     # Shutdown: Stop the scheduler
+    response_queue.stop()
+    await realtime_service.stop()
     stop_scheduler()
 
 app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
@@ -26,8 +36,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+if settings.SQLALCHEMY_REPLICA_URI:
+    app.middleware("http")(read_your_writes_middleware)
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 @app.get("/")
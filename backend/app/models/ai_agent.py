@@ -26,7 +26,7 @@ class Epic(Base):
     __tablename__ = "ai_epics"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False)
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False, index=True)
     prd_id = Column(UUID(as_uuid=True), ForeignKey("prd_documents.id"), nullable=True)
     title = Column(String, nullable=False)
     description = Column(Text)
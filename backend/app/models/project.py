@@ -1,10 +1,11 @@
 from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Integer, Enum, Date
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.ext.compiler import compiles
 import uuid
 from datetime import datetime
 import enum
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Integer, Enum, Date, UniqueConstraint
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Integer, Enum, Date, UniqueConstraint, Index, JSON, Computed
 from app.db.base import Base
 
 class TicketStatus(str, enum.Enum):
@@ -24,6 +25,11 @@ class SprintStatus(str, enum.Enum):
     ACTIVE = "active"
     COMPLETED = "completed"
 
+class TicketChangeOp(str, enum.Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
 class ProjectMemberRole(str, enum.Enum):
     ADMIN = "admin"
     MEMBER = "member"
@@ -33,8 +39,11 @@ class Project(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     name = Column(String, index=True, nullable=False)
+    key = Column(String(10), nullable=False) # Ticket key prefix, e.g. TICK
+    ticket_counter = Column(Integer, nullable=False, default=0, server_default="0") # Last issued ticket number
+    change_counter = Column(Integer, nullable=False, default=0, server_default="0") # Last ticket change log seq
     description = Column(Text)
-    owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+    owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -42,6 +51,10 @@ class Project(Base):
     sprints = relationship("Sprint", back_populates="project", cascade="all, delete-orphan")
     members = relationship("ProjectMember", back_populates="project", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("ix_projects_owner_id_created_at_id", "owner_id", "created_at", "id"),
+    )
+
 class Sprint(Base):
     __tablename__ = "sprints"
 
@@ -57,25 +70,90 @@ class Sprint(Base):
     project = relationship("Project", back_populates="sprints")
     tickets = relationship("Ticket", back_populates="sprint")
 
+    __table_args__ = (
+        Index("ix_sprints_project_id_status", "project_id", "status"),
+        Index("ix_sprints_created_at_id", "created_at", "id"),
+    )
+
+class SprintSnapshot(Base):
+    """Per-sprint ticket totals as of one day, recorded by the scheduler."""
+    __tablename__ = "sprint_snapshots"
+
+    # One row per sprint per day, so the key doubles as the burndown range index
+    sprint_id = Column(UUID(as_uuid=True), ForeignKey("sprints.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    committed_points = Column(Integer, nullable=False, default=0)
+    completed_points = Column(Integer, nullable=False, default=0)
+    remaining_points = Column(Integer, nullable=False, default=0)
+    ticket_count = Column(Integer, nullable=False, default=0)
+    done_count = Column(Integer, nullable=False, default=0)
+    recorded_at = Column(DateTime, default=datetime.utcnow)
+
+class PostgresComputed(Computed):
+    """A generated column whose expression only Postgres understands; a plain column elsewhere."""
+    inherit_cache = True
+
+@compiles(PostgresComputed, "sqlite")
+def _plain_column_on_sqlite(element, compiler, **kw):
+    # No to_tsvector in SQLite: tests get an always-NULL column, still never written
+    return ""
+
+
 class Ticket(Base):
     __tablename__ = "tickets"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     title = Column(String, index=True, nullable=False)
+    number = Column(Integer, nullable=False) # Sequential per project
+    key = Column(String(32), nullable=False) # Human key, e.g. TICK-123
     description = Column(Text)
     status = Column(Enum(TicketStatus), default=TicketStatus.TODO)
     priority = Column(Enum(TicketPriority), default=TicketPriority.MEDIUM)
     points = Column(Integer)
     assignee_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False)
-    sprint_id = Column(UUID(as_uuid=True), ForeignKey("sprints.id"), nullable=True)
+    sprint_id = Column(UUID(as_uuid=True), ForeignKey("sprints.id"), nullable=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Generated by Postgres from title/description (see migration). Declared as
+    # computed so INSERTs and UPDATEs never name it: Postgres rejects any value
+    search_vector = deferred(Column(
+        TSVECTOR().with_variant(Text(), "sqlite"),
+        PostgresComputed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+    ))
 
     project = relationship("Project")
     assignee = relationship("User", backref="tickets")
     sprint = relationship("Sprint", back_populates="tickets")
 
+    __table_args__ = (
+        Index("ix_tickets_project_id_status", "project_id", "status"),
+        Index("ix_tickets_created_at_id", "created_at", "id"),
+        Index("ix_tickets_project_id_created_at_id", "project_id", "created_at", "id"),
+        UniqueConstraint("project_id", "key", name="uq_tickets_project_id_key"),
+        Index("ix_tickets_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+class TicketChange(Base):
+    """Append-only log of ticket writes, read by clients to sync incrementally."""
+    __tablename__ = "ticket_changes"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    seq = Column(Integer, nullable=False) # Per project, in commit order
+    ticket_id = Column(UUID(as_uuid=True), nullable=False) # No FK: deleted tickets stay in the log
+    op = Column(Enum(TicketChangeOp), nullable=False)
+    data = Column(JSON) # Ticket as returned by the API; null for deletes
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("project_id", "seq", name="uq_ticket_changes_project_id_seq"),
+    )
+
 class ProjectMember(Base):
     __tablename__ = "project_members"
 
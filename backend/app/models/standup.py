@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, JSON, Date, Integer, Boolean, Enum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, JSON, Date, Integer, Boolean, Enum, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -10,23 +10,38 @@ class SessionStatus(str, enum.Enum):
     ACTIVE = "active"
     CLOSED = "closed"
 
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+# next_fire_at of a config that can never fire (no working days, bad time):
+# NULL means "not scheduled yet", so the scheduler would recheck it every tick
+NEVER_FIRES = datetime(9999, 12, 31)
+
 class StandupConfig(Base):
     __tablename__ = "standup_configs"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"))
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), index=True)
     time = Column(String) # HH:MM
     timezone = Column(String, default="UTC")
     working_days = Column(JSON) # e.g., ["Mon", "Tue", "Wed", "Thu", "Fri"]
     response_window_hours = Column(Integer, default=2)
     is_active = Column(Boolean, default=True)
     questions = Column(JSON)
+    next_fire_at = Column(DateTime, nullable=True) # UTC start of the next session, from time/timezone/working_days; NULL until scheduled
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     project = relationship("Project")
     sessions = relationship("StandupSession", back_populates="config")
 
+    __table_args__ = (
+        Index("ix_standup_configs_is_active_next_fire_at", "is_active", "next_fire_at"),
+    )
+
 class StandupSession(Base):
     __tablename__ = "standup_sessions"
 
@@ -42,6 +57,13 @@ class StandupSession(Base):
     responses = relationship("StandupResponse", back_populates="session")
     summary = relationship("StandupSummary", back_populates="session", uselist=False)
 
+    __table_args__ = (
+        Index("ix_standup_sessions_project_id_status", "project_id", "status"),
+        Index("ix_standup_sessions_project_id_created_at", "project_id", "created_at"),
+        Index("ix_standup_sessions_config_id_started_at", "config_id", "started_at"),
+        Index("ix_standup_sessions_status_ends_at", "status", "ends_at"),
+    )
+
 class StandupResponse(Base):
     __tablename__ = "standup_responses"
 
@@ -56,14 +78,35 @@ class StandupResponse(Base):
     user = relationship("User")
     session = relationship("StandupSession", back_populates="responses")
 
+    __table_args__ = (
+        UniqueConstraint("session_id", "user_id", name="uq_standup_response_session_user"),
+    )
+
 class StandupSummary(Base):
     __tablename__ = "standup_summaries"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    session_id = Column(UUID(as_uuid=True), ForeignKey("standup_sessions.id"))
+    session_id = Column(UUID(as_uuid=True), ForeignKey("standup_sessions.id"), index=True)
     summary_text = Column(Text)
     blockers_json = Column(JSON)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     session = relationship("StandupSession", back_populates="summary")
 
+class ResponseJob(Base):
+    """Durable queue entry for processing a standup response (RESPONSE_QUEUE_MODE=database)."""
+    __tablename__ = "response_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    response_id = Column(UUID(as_uuid=True), ForeignKey("standup_responses.id", ondelete="CASCADE"), nullable=False, index=True)
+    session_id = Column(UUID(as_uuid=True), nullable=False) # Jobs of one session are processed together
+    status = Column(Enum(JobStatus), nullable=False, default=JobStatus.QUEUED)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text)
+    run_after = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_response_jobs_status_run_after", "status", "run_after"),
+    )
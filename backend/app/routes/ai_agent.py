@@ -134,7 +134,8 @@ async def import_story_to_backlog(
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user)
 ) -> Any:
-    from app.models.project import Ticket, TicketStatus, TicketPriority
+    from app.models.project import Ticket, TicketStatus, TicketPriority, TicketChangeOp
+    from app.services.ticket_service import ticket_service
     
     # Load story with epic info
     story = db.query(UserStory).filter(UserStory.id == story_id).first()
@@ -155,9 +156,11 @@ async def import_story_to_backlog(
         project_id=project_id,
         sprint_id=None 
     )
+    ticket_service.assign_key(db, ticket)
     
     db.add(ticket)
     story.status = AIStatus.APPROVED
+    ticket_service.record_changes(db, [(TicketChangeOp.CREATED, ticket)])
     db.commit()
     db.refresh(ticket)
     
@@ -3,7 +3,8 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
 from app.core import security
@@ -14,17 +15,33 @@ from app.schemas.token import Token
 router = APIRouter()
 
 @router.post("/login", response_model=Token)
-def login_access_token(
-    db: Session = Depends(deps.get_db), form_data: OAuth2PasswordRequestForm = Depends()
+async def login_access_token(
+    db: AsyncSession = Depends(deps.get_async_db), form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """
     OAuth2 compatible token login, get an access token for future requests
     """
-    user = db.query(User).filter(User.email == form_data.username).first()
-    if not user or not security.verify_password(form_data.password, user.hashed_password):
+    result = await db.execute(select(User).where(User.email == form_data.username).limit(1))
+    user = result.scalars().first()
+    if not user:
+        raise HTTPException(status_code=400, detail="Incorrect email or password")
+    try:
+        verified, new_hash = await security.verify_and_update_password(
+            form_data.password, user.hashed_password
+        )
+    except security.PasswordHasherBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress, please retry",
+        )
+    if not verified:
         raise HTTPException(status_code=400, detail="Incorrect email or password")
     elif not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
+    if new_hash:
+        # Stored hash predates the configured cost; upgrade it transparently
+        user.hashed_password = new_hash
+        await db.commit()
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     return {
         "access_token": security.create_access_token(
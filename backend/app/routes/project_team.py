@@ -6,8 +6,7 @@ from app.api import deps
 from app.models.user import User
 from app.models.project import Project, ProjectMember, ProjectMemberRole
 from app.schemas import project_member as schemas
-from app.core.security import get_password_hash
-import uuid
+from app.core.security import UNUSABLE_PASSWORD
 
 router = APIRouter()
 
@@ -49,7 +48,7 @@ def invite_member(
         # Create inactive user
         user = User(
             email=invite.email,
-            hashed_password=get_password_hash(str(uuid.uuid4())), # Placeholder password
+            hashed_password=UNUSABLE_PASSWORD, # No password until the invite is accepted
             full_name=invite.email.split("@")[0],
             is_active=False
         )
@@ -82,7 +81,7 @@ def invite_member(
 @router.get("/", response_model=List[schemas.ProjectMember])
 def list_members(
     project_id: UUID,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user)
 ) -> Any:
     # Verify user is a member of the project
@@ -1,19 +1,23 @@
-from typing import Any, List
+from typing import Any, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.pagination import paginate, set_next_cursor
 from app.models.project import Project
 from app.schemas.project import Project as ProjectSchema, ProjectCreate, ProjectUpdate
 from app.models.user import User
+from app.services.ticket_service import ticket_service
 
 router = APIRouter()
 
 @router.get("", response_model=List[ProjectSchema])
 def read_projects(
+    response: Response,
     db: Session = Depends(deps.get_db),
+    cursor: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(deps.get_current_active_user),
@@ -21,7 +25,9 @@ def read_projects(
     """
     Retrieve projects.
     """
-    projects = db.query(Project).filter(Project.owner_id == current_user.id).offset(skip).limit(limit).all()
+    query = db.query(Project).filter(Project.owner_id == current_user.id)
+    projects = paginate(query, Project, cursor, skip, limit).all()
+    set_next_cursor(response, projects, limit)
     return projects
 
 @router.post("", response_model=ProjectSchema)
@@ -34,7 +40,9 @@ def create_project(
     """
     Create new project.
     """
-    project = Project(**project_in.dict(), owner_id=current_user.id)
+    project_data = project_in.dict()
+    project_data["key"] = project_data["key"] or ticket_service.derive_project_key(project_in.name)
+    project = Project(**project_data, owner_id=current_user.id)
     db.add(project)
     db.commit()
     db.refresh(project)
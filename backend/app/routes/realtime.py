@@ -0,0 +1,62 @@
+import asyncio
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.api import deps
+from app.database import SessionLocal
+from app.models.project import Project, ProjectMember
+from app.services.realtime_service import realtime_service
+
+router = APIRouter()
+
+def _authorize(token: str, project_id: UUID) -> None:
+    with SessionLocal() as db:
+        user = deps.get_user_for_token(db, token)
+        if not user.is_active:
+            raise HTTPException(status_code=400, detail="Inactive user")
+
+        # Same rule as the project's member list: its owner or one of its members
+        project = db.query(Project).get(project_id)
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+        member_check = db.query(ProjectMember.id).filter(
+            ProjectMember.project_id == project_id,
+            ProjectMember.user_id == user.id
+        ).first()
+        if not member_check and project.owner_id != user.id:
+            raise HTTPException(status_code=403, detail="You are not a member of this project")
+
+@router.websocket("/projects/{project_id}/ws")
+async def project_events(
+    websocket: WebSocket,
+    project_id: UUID,
+    token: str = Query(...),
+):
+    """
+    Stream ticket, sprint, standup session and standup response events for a project.
+    Browsers can't set headers on WebSockets, so the access token goes in `token`.
+    On {"type": "resync"} some events were dropped: catch up via /tickets/changes.
+    """
+    try:
+        await run_in_threadpool(_authorize, token, project_id)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    async with realtime_service.subscribe(project_id) as queue:
+        async def forward():
+            while True:
+                await websocket.send_json(await queue.get())
+
+        sender = asyncio.create_task(forward())
+        try:
+            # Clients don't send anything; receiving is how we notice them leave
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            sender.cancel()
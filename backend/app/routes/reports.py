@@ -1,59 +1,54 @@
-from typing import Any, Dict
+from typing import Any
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.api import deps
+from app.models.project import Sprint
 from app.models.user import User
-from app.models.project import Ticket, Project, Sprint, TicketStatus
-from app.models.standup import StandupSession, StandupResponse
+from app.schemas.project import SprintBurndown, ProjectVelocity
+from app.services.metrics_service import metrics_service
+from app.services.sprint_service import sprint_service
 
 router = APIRouter()
 
 @router.get("/metrics")
-def get_dashboard_metrics(
+async def get_dashboard_metrics(
     project_id: UUID = Query(...),
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_active_user)
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: User = Depends(deps.get_current_active_user_async)
 ) -> Any:
     """
     Returns real-time metrics for a specific project dashboard.
     """
-    # Ticket counts by status
-    ticket_metrics = db.query(
-        Ticket.status, func.count(Ticket.id)
-    ).filter(Ticket.project_id == project_id).group_by(Ticket.status).all()
-    
-    stats = {status.value: count for status, count in ticket_metrics}
-    for s in TicketStatus:
-        if s.value not in stats:
-            stats[s.value] = 0
-
-    # Active sprint info
-    active_sprint = db.query(Sprint).filter(
-        Sprint.project_id == project_id,
-        Sprint.status == "active"
-    ).first()
-
-    # Standup completion (last 5 sessions)
-    recent_sessions = db.query(StandupSession).filter(
-        StandupSession.project_id == project_id
-    ).order_by(StandupSession.created_at.desc()).limit(5).all()
-    
-    completion_rates = []
-    for session in recent_sessions:
-        responses = db.query(StandupResponse).filter(StandupResponse.session_id == session.id).count()
-        # In a real app, we'd compare against actual member count
-        completion_rates.append({
-            "date": session.created_at.date().isoformat(),
-            "responses": responses
-        })
+    return await metrics_service.get_dashboard_metrics(db, project_id)
 
+@router.get("/sprints/{sprint_id}/burndown", response_model=SprintBurndown)
+async def get_sprint_burndown(
+    sprint_id: UUID,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: User = Depends(deps.get_current_active_user_async)
+) -> Any:
+    """
+    Daily remaining/completed points for a sprint, from the scheduler's snapshots.
+    """
+    sprint = await db.get(Sprint, sprint_id)
+    if not sprint:
+        raise HTTPException(status_code=404, detail="Sprint not found")
     return {
-        "tickets": stats,
-        "active_sprint": {
-            "name": active_sprint.name if active_sprint else "No Active Sprint",
-            "id": active_sprint.id if active_sprint else None
-        },
-        "standup_history": completion_rates
+        "sprint_id": sprint.id,
+        "start_date": sprint.start_date,
+        "end_date": sprint.end_date,
+        "snapshots": await sprint_service.burndown(db, sprint_id),
     }
+
+@router.get("/velocity", response_model=ProjectVelocity)
+async def get_velocity(
+    project_id: UUID = Query(...),
+    sprints: int = Query(3, ge=1, le=20),
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: User = Depends(deps.get_current_active_user_async)
+) -> Any:
+    """
+    Rolling velocity over the project's last completed sprints.
+    """
+    return await sprint_service.velocity(db, project_id, sprints)
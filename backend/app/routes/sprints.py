@@ -1,29 +1,66 @@
-from typing import Any, List
+from typing import Any, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session, aliased
 
 from app.api import deps
-from app.models.project import Sprint, Project
-from app.schemas.project import Sprint as SprintSchema, SprintCreate, SprintUpdate
+from app.api.pagination import paginate, set_next_cursor
+from app.models.project import Sprint, SprintStatus, Project, Ticket, TicketStatus
+from app.schemas.project import Sprint as SprintSchema, SprintCreate, SprintUpdate, SprintWithStats, SprintClose, SprintCloseResult
 from app.models.user import User
+from app.services.sprint_service import sprint_service
 
 router = APIRouter()
 
-@router.get("", response_model=List[SprintSchema])
+@router.get("", response_model=List[SprintWithStats])
 def read_sprints(
-    db: Session = Depends(deps.get_db),
+    response: Response,
+    db: Session = Depends(deps.get_read_db),
+    project_id: Optional[UUID] = None,
+    cursor: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    Retrieve sprints.
+    Retrieve sprints with their ticket counts and points.
     """
-    # Simply returning all sprints for now, likely need filtering by project
-    sprints = db.query(Sprint).offset(skip).limit(limit).all()
-    return sprints
+    query = select(Sprint)
+    if project_id:
+        query = query.where(Sprint.project_id == project_id)
+    page = paginate(query, Sprint, cursor, skip, limit).subquery("page")
+    page_sprint = aliased(Sprint, page)
+
+    # Aggregate only the tickets of this page's sprints, then LEFT JOIN so
+    # sprints without tickets still come back
+    stats = select(
+        Ticket.sprint_id,
+        func.count(Ticket.id).label("ticket_count"),
+        func.coalesce(func.sum(Ticket.points), 0).label("committed_points"),
+        func.coalesce(func.sum(case((Ticket.status == TicketStatus.DONE, Ticket.points), else_=0)), 0).label("completed_points"),
+        *[func.sum(case((Ticket.status == s, 1), else_=0)).label(s.value) for s in TicketStatus],
+    ).where(Ticket.sprint_id.in_(select(page.c.id))).group_by(Ticket.sprint_id).subquery("stats")
+
+    rows = db.execute(
+        select(page_sprint, stats)
+        .outerjoin(stats, stats.c.sprint_id == page.c.id)
+        .order_by(page.c.created_at, page.c.id)
+    ).all()
+    set_next_cursor(response, [row[0] for row in rows], limit)
+    return [
+        {
+            **SprintSchema.from_orm(row[0]).dict(),
+            "stats": {
+                "ticket_count": row.ticket_count or 0,
+                "committed_points": row.committed_points or 0,
+                "completed_points": row.completed_points or 0,
+                "tickets_by_status": {s: getattr(row, s.value) or 0 for s in TicketStatus},
+            },
+        }
+        for row in rows
+    ]
 
 @router.post("", response_model=SprintSchema)
 def create_sprint(
@@ -77,14 +114,55 @@ def update_sprint(
         raise HTTPException(status_code=404, detail="Sprint not found")
     
     sprint_data = sprint_in.dict(exclude_unset=True)
+    completing = sprint.status != SprintStatus.COMPLETED and sprint_data.get("status") == SprintStatus.COMPLETED
     for field, value in sprint_data.items():
         setattr(sprint, field, value)
     
     db.add(sprint)
+    if completing:
+        # Final burndown point, which velocity reports read
+        db.flush()
+        sprint_service.record_snapshots(db, [sprint.id])
     db.commit()
     db.refresh(sprint)
     return sprint
 
+@router.post("/{id}/close", response_model=SprintCloseResult)
+def close_sprint(
+    *,
+    db: Session = Depends(deps.get_db),
+    id: UUID,
+    close_in: SprintClose,
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Complete a sprint and move its unfinished tickets to another sprint or the backlog.
+    """
+    # Lock the sprint so two concurrent closes can't both move its tickets
+    sprint = db.query(Sprint).filter(Sprint.id == id).with_for_update().first()
+    if not sprint:
+        raise HTTPException(status_code=404, detail="Sprint not found")
+    if sprint.status == SprintStatus.COMPLETED:
+        raise HTTPException(status_code=400, detail="Sprint is already completed")
+
+    target = None
+    if close_in.target_sprint_id:
+        target = db.query(Sprint).filter(Sprint.id == close_in.target_sprint_id).first()
+        if not target or target.project_id != sprint.project_id:
+            raise HTTPException(status_code=404, detail="Target sprint not found")
+        if target.id == sprint.id or target.status == SprintStatus.COMPLETED:
+            raise HTTPException(status_code=400, detail="Target sprint must be another open sprint")
+
+    moved, completed = sprint_service.close_sprint(db, sprint, target)
+    db.commit()
+    db.refresh(sprint)
+    return {
+        "sprint": sprint,
+        "target_sprint_id": target.id if target else None,
+        "moved_tickets": moved,
+        "completed_tickets": completed,
+    }
+
 @router.delete("/{id}", response_model=SprintSchema)
 def delete_sprint(
     *,
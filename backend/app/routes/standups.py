@@ -4,12 +4,18 @@ from datetime import datetime
 import pytz
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.core.singleflight import coalesce
+from app.db.events import on_committed_writes
 from app.models.standup import StandupConfig, StandupResponse, StandupSummary, StandupSession, SessionStatus
 from app.models.user import User
 from app.schemas import standup as schemas
+from app.services.realtime_service import realtime_service
+from app.services.response_queue import response_queue
 from app.services.standup_service import standup_service
 
 router = APIRouter()
@@ -39,26 +45,29 @@ def configure_standup(
         # Create new
         config = StandupConfig(**config_in.dict())
         db.add(config)
+    standup_service.schedule(config, datetime.utcnow())
     
     db.commit()
     db.refresh(config)
     return config
 
 @router.get("/active", response_model=Optional[schemas.StandupSession])
-def get_active_session(
+async def get_active_session(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     project_id: UUID = Query(...),
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: User = Depends(deps.get_current_active_user_async),
 ) -> Any:
     """
     Return active session for project.
     """
-    session = db.query(StandupSession).filter(
-        StandupSession.project_id == project_id,
-        StandupSession.status == SessionStatus.ACTIVE
-    ).first()
-    return session
+    result = await db.execute(
+        select(StandupSession).where(
+            StandupSession.project_id == project_id,
+            StandupSession.status == SessionStatus.ACTIVE
+        ).limit(1)
+    )
+    return result.scalars().first()
 
 @router.post("/respond", response_model=schemas.StandupResponse)
 def respond_to_standup(
@@ -85,6 +94,7 @@ def respond_to_standup(
         StandupResponse.user_id == current_user.id
     ).first()
     
+    op = "updated" if response else "created"
     if response:
         # Update
         response.yesterday = response_in.yesterday
@@ -98,25 +108,50 @@ def respond_to_standup(
         )
         db.add(response)
     
+    db.flush()
+    # Ticket updates are applied by the response queue once this commits
+    response_queue.enqueue(db, response)
+    realtime_service.publish(db, session.project_id, {
+        "type": "standup_response", "op": op, "id": response.id, "session_id": session.id,
+    })
     db.commit()
     db.refresh(response)
     
-    # Process for ticket updates (Async-like but synchronous for simplicity here)
-    standup_service.process_response(db, response.id)
-    
     return response
 
-@router.get("/summary/{session_id}", response_model=schemas.StandupSummary)
-def get_standup_summary(
-    session_id: UUID,
+@router.get("/responses/{response_id}/status", response_model=schemas.ResponseProcessingStatus)
+def get_response_status(
+    response_id: UUID,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Return ticket-update processing status of a response.
+    """
+    status = response_queue.status(db, response_id)
+    if not status:
+        raise HTTPException(status_code=404, detail="No processing job found for this response")
+    return status
+
+@router.get("/summary/{session_id}", response_model=schemas.StandupSummary)
+@coalesce("standups.summary", key=lambda session_id, **_: session_id)
+async def get_standup_summary(
+    session_id: UUID,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: User = Depends(deps.get_current_active_user_async),
 ) -> Any:
     """
     Return generated summary.
     """
-    summary = db.query(StandupSummary).filter(StandupSummary.session_id == session_id).first()
+    result = await db.execute(
+        select(StandupSummary).where(StandupSummary.session_id == session_id).limit(1)
+    )
+    summary = result.scalars().first()
     if not summary:
         raise HTTPException(status_code=404, detail="Summary not found. It might still be generating or the session is active.")
     return summary
 
+@on_committed_writes((StandupSummary,), key=lambda session, obj: obj.session_id)
+def _summaries_committed(session_ids):
+    # Don't hand a "not generated yet" 404 to requests that arrive after it was saved
+    get_standup_summary.flight.forget_many(session_ids)
@@ -1,32 +1,47 @@
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import ValidationError
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api import deps
-from app.models.project import Ticket
-from app.schemas.project import Ticket as TicketSchema, TicketCreate, TicketUpdate
+from app.api.pagination import decode_cursor, encode_cursor, paginate, set_next_cursor
+from app.models.project import Ticket, TicketChange, TicketChangeOp, TicketStatus, TicketPriority
+from app.schemas.project import (
+    Ticket as TicketSchema, TicketCreate, TicketUpdate,
+    TicketBatchRequest, TicketBatchResponse, TicketBatchResult, TicketSearchResult, TicketChangeFeed, Board,
+)
 from app.models.user import User
+from app.services.ticket_service import ticket_service
+from app.services.search_service import search_service
 
 router = APIRouter()
 
 @router.get("", response_model=List[TicketSchema])
-def read_tickets(
-    db: Session = Depends(deps.get_db),
+async def read_tickets(
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
     project_id: Optional[UUID] = None,
+    cursor: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: User = Depends(deps.get_current_active_user_async),
 ) -> Any:
     """
     Retrieve tickets.
+    Pass the X-Next-Cursor response header back as `cursor` for the next page.
     """
-    query = db.query(Ticket)
+    query = select(Ticket)
     if project_id:
-        query = query.filter(Ticket.project_id == project_id)
+        query = query.where(Ticket.project_id == project_id)
     
-    tickets = query.offset(skip).limit(limit).all()
+    result = await db.execute(paginate(query, Ticket, cursor, skip, limit))
+    tickets = result.scalars().all()
+    set_next_cursor(response, tickets, limit)
     return tickets
 
 @router.post("", response_model=TicketSchema)
@@ -40,22 +55,251 @@ def create_ticket(
     Create new ticket.
     """
     ticket = Ticket(**ticket_in.dict())
+    try:
+        ticket_service.assign_key(db, ticket)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Project not found")
     db.add(ticket)
+    ticket_service.record_changes(db, [(TicketChangeOp.CREATED, ticket)])
     db.commit()
     db.refresh(ticket)
     return ticket
 
-@router.get("/{id}", response_model=TicketSchema)
-def read_ticket(
+@router.post("/batch", response_model=TicketBatchResponse)
+def batch_tickets(
     *,
     db: Session = Depends(deps.get_db),
-    id: UUID,
+    batch_in: TicketBatchRequest,
     current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Apply many ticket creates, updates and deletes in one transaction.
+    Creates run first, then updates, then deletes, each as a single bulk statement.
+    Invalid or missing items are reported per item without aborting the rest.
+    """
+    results: Dict[int, TicketBatchResult] = {}
+    creates, updates, deletes = [], [], []
+    changes = []
+    # Each ticket may be updated (or deleted) once per batch: all updates go out
+    # in one statement, so repeats would all report the last one's result
+    seen = {"update": set(), "delete": set()}
+
+    for index, operation in enumerate(batch_in.operations):
+        try:
+            if operation.op == "create":
+                creates.append((index, TicketCreate(**(operation.data or {})).dict()))
+            elif operation.id is None:
+                raise ValueError("id is required")
+            elif operation.id in seen[operation.op]:
+                raise ValueError(f"duplicate {operation.op} of ticket {operation.id} in this batch")
+            elif operation.op == "update":
+                updates.append((index, operation.id, TicketUpdate(**(operation.data or {})).dict(exclude_unset=True)))
+            else:
+                deletes.append((index, operation.id))
+        except (ValidationError, ValueError) as e:
+            detail = e.errors() if isinstance(e, ValidationError) else str(e)
+            results[index] = TicketBatchResult(index=index, op=operation.op, status_code=422, detail=detail)
+        else:
+            if operation.op != "create":
+                seen[operation.op].add(operation.id)
+
+    # One lookup to find which referenced tickets exist, and the project each is in
+    referenced = {ticket_id for _, ticket_id, _ in updates} | {ticket_id for _, ticket_id in deletes}
+    existing: Dict[UUID, UUID] = {}
+    if referenced:
+        existing = dict(db.query(Ticket.id, Ticket.project_id).filter(Ticket.id.in_(referenced)))
+    for index, ticket_id, *_ in updates + deletes:
+        if ticket_id not in existing:
+            op = batch_in.operations[index].op
+            results[index] = TicketBatchResult(index=index, op=op, status_code=404, detail="Ticket not found")
+    updates = [u for u in updates if u[1] in existing]
+    deletes = [d for d in deletes if d[1] in existing]
+
+    # New tickets, and tickets moved to another project, need a key in their project
+    moves = [
+        u for u in updates
+        if u[2].get("project_id") not in (None, existing[u[1]])
+    ]
+
+    # Every project the batch writes to (keys, change log), locked up front and
+    # in a fixed order so concurrent batches and moves can't deadlock on them
+    ticket_service.lock_projects(db, [
+        *(values["project_id"] for _, values in creates),
+        *existing.values(),
+        *(values["project_id"] for _, _, values in moves),
+    ])
+
+    # Reserve ticket keys with one counter bump per project
+    by_project: Dict[UUID, list] = {}
+    for _, values in creates:
+        by_project.setdefault(values["project_id"], []).append(values)
+    for _, _, values in moves:
+        by_project.setdefault(values["project_id"], []).append(values)
+    for project_id in sorted(by_project):
+        needing_keys = by_project[project_id]
+        try:
+            keys = ticket_service.allocate_keys(db, project_id, len(needing_keys))
+        except ValueError:
+            keys = [(None, None)] * len(needing_keys)
+        for values, (number, key) in zip(needing_keys, keys):
+            values["number"], values["key"] = number, key
+    for index, values in creates:
+        if values["key"] is None:
+            results[index] = TicketBatchResult(index=index, op="create", status_code=404, detail="Project not found")
+    for index, _, values in moves:
+        if values["key"] is None:
+            results[index] = TicketBatchResult(index=index, op="update", status_code=404, detail="Project not found")
+    creates = [c for c in creates if c[1]["key"] is not None]
+    updates = [u for u in updates if u[2].get("key", "") is not None]
+
+    try:
+        if creates:
+            created = db.scalars(
+                insert(Ticket).returning(Ticket, sort_by_parameter_order=True),
+                [values for _, values in creates],
+            ).all()
+            for (index, _), ticket in zip(creates, created):
+                changes.append((TicketChangeOp.CREATED, ticket))
+                results[index] = TicketBatchResult(
+                    index=index, op="create", status_code=201, ticket=TicketSchema.from_orm(ticket)
+                )
+
+        if updates:
+            # Bulk UPDATE by primary key: one executemany, then one SELECT for the new state
+            db.execute(update(Ticket), [{"id": ticket_id, **values} for _, ticket_id, values in updates])
+            updated = {
+                t.id: t for t in db.query(Ticket).populate_existing().filter(Ticket.id.in_({u[1] for u in updates}))
+            }
+            for index, ticket_id, _ in updates:
+                changes.append((TicketChangeOp.UPDATED, updated[ticket_id]))
+                results[index] = TicketBatchResult(
+                    index=index, op="update", status_code=200, ticket=TicketSchema.from_orm(updated[ticket_id])
+                )
+
+        if deletes:
+            deleted = {
+                t.id: t for t in db.scalars(
+                    delete(Ticket).where(Ticket.id.in_({d[1] for d in deletes})).returning(Ticket)
+                )
+            }
+            for index, ticket_id in deletes:
+                ticket = deleted.get(ticket_id)
+                if ticket:
+                    changes.append((TicketChangeOp.DELETED, ticket))
+                results[index] = TicketBatchResult(
+                    index=index, op="delete",
+                    status_code=200 if ticket else 404,
+                    ticket=TicketSchema.from_orm(ticket) if ticket else None,
+                    detail=None if ticket else "Ticket not found",
+                )
+
+        # The bulk UPDATE leaves no attribute history, so say where moved tickets came from
+        moved_from = {ticket_id: existing[ticket_id] for _, ticket_id, values in moves if values["key"] is not None}
+        ticket_service.record_changes(db, changes, moved_from)
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=f"Batch rejected, no changes applied: {e.orig}")
+
+    return TicketBatchResponse(results=[results[i] for i in range(len(batch_in.operations))])
+
+@router.get("/search", response_model=List[TicketSearchResult])
+async def search_tickets(
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    q: str = Query(..., min_length=1),
+    project_id: Optional[UUID] = None,
+    status: Optional[TicketStatus] = None,
+    priority: Optional[TicketPriority] = None,
+    skip: int = 0,
+    limit: int = Query(20, le=100),
+    current_user: User = Depends(deps.get_current_active_user_async),
+) -> Any:
+    """
+    Full-text search over ticket titles and descriptions, best matches first.
+    """
+    results = await search_service.search(db, q, project_id, status, priority, skip, limit)
+    return [{"ticket": ticket, "rank": rank} for ticket, rank in results]
+
+@router.get("/board", response_model=Board)
+async def read_board(
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    project_id: UUID = Query(...),
+    sprint_id: Optional[UUID] = None,
+    status: Optional[TicketStatus] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(deps.get_current_active_user_async),
+) -> Any:
+    """
+    Kanban board: tickets grouped by status with per-column counts and points.
+    To load more of one column, pass its `next_cursor` as `cursor` with `status`.
+    """
+    if cursor and not status:
+        raise HTTPException(status_code=400, detail="cursor requires status")
+    after = decode_cursor(cursor) if cursor else None
+
+    result = await db.execute(ticket_service.board_query(project_id, sprint_id, status, after, limit))
+    columns = {
+        s: {"status": s, "count": 0, "points": 0, "tickets": [], "next_cursor": None}
+        for s in TicketStatus if status in (None, s)
+    }
+    for ticket, count, points, in_page in result.all():
+        column = columns.get(ticket.status)
+        if column is None:
+            continue
+        column["count"], column["points"] = count, points
+        if not in_page:
+            continue
+        if len(column["tickets"]) < limit:
+            column["tickets"].append(ticket)
+        else:
+            last = column["tickets"][-1]
+            column["next_cursor"] = encode_cursor(last.created_at, last.id)
+    return {"project_id": project_id, "sprint_id": sprint_id, "columns": list(columns.values())}
+
+@router.get("/changes", response_model=TicketChangeFeed)
+async def read_ticket_changes(
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    project_id: UUID = Query(...),
+    since: Optional[int] = Query(None, ge=0),
+    limit: int = Query(500, ge=1, le=1000),
+    current_user: User = Depends(deps.get_current_active_user_async),
+) -> Any:
+    """
+    Ticket creates, updates and deletes in a project after `since`, oldest first.
+    Without `since`, only the current cursor is returned: take it before
+    loading the ticket list, then poll with it and replay changes in order.
+    """
+    if since is None:
+        result = await db.execute(
+            select(func.coalesce(func.max(TicketChange.seq), 0)).where(TicketChange.project_id == project_id)
+        )
+        return {"changes": [], "cursor": result.scalar_one(), "has_more": False}
+
+    result = await db.execute(
+        select(TicketChange)
+        .where(TicketChange.project_id == project_id, TicketChange.seq > since)
+        .order_by(TicketChange.seq)
+        .limit(limit)
+    )
+    changes = result.scalars().all()
+    return {
+        "changes": changes,
+        "cursor": changes[-1].seq if changes else since,
+        "has_more": len(changes) == limit,
+    }
+
+@router.get("/{id}", response_model=TicketSchema)
+async def read_ticket(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    id: UUID,
+    current_user: User = Depends(deps.get_current_active_user_async),
 ) -> Any:
     """
     Get ticket by ID.
     """
-    ticket = db.query(Ticket).filter(Ticket.id == id).first()
+    ticket = await db.get(Ticket, id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
     return ticket
@@ -76,11 +320,27 @@ def update_ticket(
         raise HTTPException(status_code=404, detail="Ticket not found")
     
     ticket_data = ticket_in.dict(exclude_unset=True)
+    moved = ticket_data.get("project_id") not in (None, ticket.project_id)
+    if moved:
+        # Takes a key in one project and logs the change in both: lock them together
+        ticket_service.lock_projects(db, [ticket.project_id, ticket_data["project_id"]])
     for field, value in ticket_data.items():
         setattr(ticket, field, value)
-    
+    if moved:
+        # Keys are numbered per project: a moved ticket gets the next one in its new project
+        try:
+            ticket_service.assign_key(db, ticket)
+        except ValueError:
+            db.rollback()
+            raise HTTPException(status_code=404, detail="Project not found")
+
     db.add(ticket)
-    db.commit()
+    try:
+        ticket_service.record_changes(db, [(TicketChangeOp.UPDATED, ticket)])
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=f"Ticket update rejected: {e.orig}")
     db.refresh(ticket)
     return ticket
 
@@ -99,5 +359,6 @@ def delete_ticket(
         raise HTTPException(status_code=404, detail="Ticket not found")
     
     db.delete(ticket)
+    ticket_service.record_changes(db, [(TicketChangeOp.DELETED, ticket)])
     db.commit()
     return ticket
@@ -1,10 +1,11 @@
-from typing import Any, List
+from typing import Any, List, Optional
 
-from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Response
 from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.pagination import paginate, set_next_cursor
 from app.models.user import User
 from app.schemas.user import User as UserSchema, UserUpdate
 
@@ -12,7 +13,9 @@ router = APIRouter()
 
 @router.get("", response_model=List[UserSchema])
 def read_users(
+    response: Response,
     db: Session = Depends(deps.get_db),
+    cursor: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(deps.get_current_active_user),
@@ -20,7 +23,8 @@ def read_users(
     """
     Retrieve users.
     """
-    users = db.query(User).offset(skip).limit(limit).all()
+    users = paginate(db.query(User), User, cursor, skip, limit).all()
+    set_next_cursor(response, users, limit)
     return users
 
 @router.get("/me", response_model=UserSchema)
@@ -1,7 +1,7 @@
-from pydantic import BaseModel, UUID4
-from typing import Optional, List
+from pydantic import BaseModel, Field, UUID4
+from typing import Any, Dict, Literal, Optional, List
 from datetime import datetime, date
-from app.models.project import TicketStatus, TicketPriority, SprintStatus
+from app.models.project import TicketStatus, TicketPriority, SprintStatus, TicketChangeOp
 
 # Shared properties
 class ProjectBase(BaseModel):
@@ -10,12 +10,14 @@ class ProjectBase(BaseModel):
 
 class ProjectCreate(ProjectBase):
     name: str
+    key: Optional[str] = Field(None, pattern=r"^[A-Z][A-Z0-9]{0,9}$", description="Ticket key prefix, derived from the name if omitted")
 
 class ProjectUpdate(ProjectBase):
     pass
 
 class ProjectInDBBase(ProjectBase):
     id: UUID4
+    key: str
     owner_id: UUID4
     created_at: datetime
     updated_at: datetime
@@ -49,6 +51,54 @@ class Sprint(SprintBase):
     class Config:
         from_attributes = True
 
+class SprintStats(BaseModel):
+    ticket_count: int = 0
+    committed_points: int = 0
+    completed_points: int = 0
+    tickets_by_status: Dict[TicketStatus, int] = {}
+
+class SprintWithStats(Sprint):
+    stats: SprintStats
+
+class SprintClose(BaseModel):
+    target_sprint_id: Optional[UUID4] = None  # unfinished tickets go to the backlog if omitted
+
+class SprintCloseResult(BaseModel):
+    sprint: Sprint
+    target_sprint_id: Optional[UUID4] = None
+    moved_tickets: int
+    completed_tickets: int
+
+# Sprint Report Schemas
+class SprintSnapshot(BaseModel):
+    day: date
+    committed_points: int
+    completed_points: int
+    remaining_points: int
+    ticket_count: int
+    done_count: int
+
+    class Config:
+        from_attributes = True
+
+class SprintBurndown(BaseModel):
+    sprint_id: UUID4
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    snapshots: List[SprintSnapshot]
+
+class SprintVelocity(BaseModel):
+    sprint_id: UUID4
+    name: str
+    end_date: Optional[date] = None
+    committed_points: int
+    completed_points: int
+
+class ProjectVelocity(BaseModel):
+    project_id: UUID4
+    average_velocity: float
+    sprints: List[SprintVelocity]
+
 # Ticket Schemas
 class TicketBase(BaseModel):
     title: Optional[str] = None
@@ -69,8 +119,64 @@ class TicketUpdate(TicketBase):
 
 class Ticket(TicketBase):
     id: UUID4
+    number: int
+    key: str
     created_at: datetime
     updated_at: datetime
 
     class Config:
         from_attributes = True
+
+class TicketSearchResult(BaseModel):
+    ticket: Ticket
+    rank: float
+
+# Kanban Board Schemas
+class BoardColumn(BaseModel):
+    status: TicketStatus
+    count: int  # whole column, not just this page
+    points: int
+    tickets: List[Ticket]
+    next_cursor: Optional[str] = None  # pass back with `status` to load more of this column
+
+class Board(BaseModel):
+    project_id: UUID4
+    sprint_id: Optional[UUID4] = None
+    columns: List[BoardColumn]
+
+# Ticket Change Feed Schemas
+class TicketChange(BaseModel):
+    seq: int
+    ticket_id: UUID4
+    op: TicketChangeOp
+    data: Optional[Dict[str, Any]] = None  # Ticket, null for deletes
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class TicketChangeFeed(BaseModel):
+    changes: List[TicketChange]
+    cursor: int  # pass back as `since`
+    has_more: bool
+
+# Batch Ticket Schemas
+TICKET_BATCH_MAX_OPERATIONS = 500
+
+class TicketBatchOperation(BaseModel):
+    op: Literal["create", "update", "delete"]
+    id: Optional[UUID4] = None  # required for update/delete
+    data: Optional[Dict[str, Any]] = None  # TicketCreate for create, TicketUpdate for update
+
+class TicketBatchRequest(BaseModel):
+    operations: List[TicketBatchOperation] = Field(..., min_length=1, max_length=TICKET_BATCH_MAX_OPERATIONS)
+
+class TicketBatchResult(BaseModel):
+    index: int
+    op: str
+    status_code: int
+    ticket: Optional[Ticket] = None
+    detail: Optional[Any] = None
+
+class TicketBatchResponse(BaseModel):
+    results: List[TicketBatchResult]
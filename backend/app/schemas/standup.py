@@ -1,13 +1,20 @@
 from typing import List, Optional, Any
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 import enum
+from app.models.standup import NEVER_FIRES
 
 class SessionStatus(str, enum.Enum):
     ACTIVE = "active"
     CLOSED = "closed"
 
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
 # Configuration Schemas
 class StandupConfigBase(BaseModel):
     project_id: UUID
@@ -31,9 +38,15 @@ class StandupConfigUpdate(BaseModel):
 
 class StandupConfig(StandupConfigBase):
     id: UUID
+    next_fire_at: Optional[datetime] = None  # None when it can never fire
     created_at: datetime
     updated_at: datetime
 
+    @field_validator("next_fire_at")
+    @classmethod
+    def _never_fires(cls, value: Optional[datetime]) -> Optional[datetime]:
+        return None if value == NEVER_FIRES else value
+
     class Config:
         from_attributes = True
 
@@ -70,6 +83,13 @@ class StandupResponse(StandupResponseBase):
     class Config:
         from_attributes = True
 
+class ResponseProcessingStatus(BaseModel):
+    response_id: UUID
+    status: JobStatus
+    attempts: int
+    last_error: Optional[str] = None
+    updated_at: Optional[datetime] = None
+
 # Summary Schemas
 class StandupSummaryBase(BaseModel):
     session_id: UUID
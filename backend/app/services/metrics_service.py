@@ -0,0 +1,114 @@
+import threading
+from uuid import UUID
+from typing import Any, Dict
+from sqlalchemy import case, func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.singleflight import SingleFlight
+from app.db.events import ALL, on_committed_writes
+from app.models.project import Ticket, Sprint, TicketStatus, SprintStatus
+from app.models.standup import StandupSession, StandupResponse
+
+class MetricsService:
+    def __init__(self):
+        # Per-project dashboard rollups; dropped on committed writes in this
+        # process and, on Postgres, on other processes' writes as they arrive
+        # over the realtime NOTIFY channel. The TTL bounds anything missed.
+        self.cache = TTLCache(settings.METRICS_CACHE_TTL_SECONDS, settings.METRICS_CACHE_MAX_PROJECTS)
+        # Cache misses for the same project share one query
+        self.flight = SingleFlight("reports.metrics")
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self, project_id: Any = ALL) -> None:
+        with self._lock:
+            self._generation += 1
+            if project_id is ALL:
+                self.cache.clear()
+            else:
+                self.cache.invalidate(project_id)
+        self.flight.forget_many([project_id])
+
+    def dashboard_query(self, project_id: UUID):
+        """
+        Ticket counts, active sprint and the last 5 standups with response counts
+        in one statement: one row per recent session (or a single row if none).
+        """
+        ticket_stats = select(*[
+            func.coalesce(func.sum(case((Ticket.status == s, 1), else_=0)), 0).label(s.value)
+            for s in TicketStatus
+        ]).where(Ticket.project_id == project_id).subquery("ticket_stats")
+
+        active_sprint = select(Sprint.id, Sprint.name).where(
+            Sprint.project_id == project_id,
+            Sprint.status == SprintStatus.ACTIVE
+        ).limit(1).subquery("active_sprint")
+
+        recent_sessions = select(StandupSession.id, StandupSession.created_at).where(
+            StandupSession.project_id == project_id
+        ).order_by(StandupSession.created_at.desc()).limit(5).subquery("recent_sessions")
+
+        history = select(
+            recent_sessions.c.created_at,
+            func.count(StandupResponse.id).label("responses"),
+        ).select_from(
+            recent_sessions.outerjoin(StandupResponse, StandupResponse.session_id == recent_sessions.c.id)
+        ).group_by(recent_sessions.c.id, recent_sessions.c.created_at).subquery("history")
+
+        return select(
+            ticket_stats,
+            active_sprint.c.id.label("sprint_id"),
+            active_sprint.c.name.label("sprint_name"),
+            history.c.created_at.label("session_created_at"),
+            history.c.responses,
+        ).select_from(
+            ticket_stats.outerjoin(active_sprint, true()).outerjoin(history, true())
+        ).order_by(history.c.created_at.desc())
+
+    async def get_dashboard_metrics(self, db: AsyncSession, project_id: UUID) -> Dict[str, Any]:
+        cached = self.cache.get(project_id)
+        if cached is not None:
+            return cached
+        return await self.flight.do(project_id, lambda: self._load_dashboard_metrics(db, project_id))
+
+    async def _load_dashboard_metrics(self, db: AsyncSession, project_id: UUID) -> Dict[str, Any]:
+        generation = self._generation
+        rows = (await db.execute(self.dashboard_query(project_id))).mappings().all()
+        first = rows[0]
+        metrics = {
+            "tickets": {s.value: int(first[s.value]) for s in TicketStatus},
+            "active_sprint": {
+                "name": first["sprint_name"] or "No Active Sprint",
+                "id": first["sprint_id"],
+            },
+            # In a real app, we'd compare against actual member count
+            "standup_history": [
+                {"date": row["session_created_at"].date().isoformat(), "responses": row["responses"]}
+                for row in rows if row["session_created_at"] is not None
+            ],
+        }
+        with self._lock:
+            # Skip caching if a write was committed while we were reading
+            if self._generation == generation:
+                self.cache.set(project_id, metrics)
+        return metrics
+
+metrics_service = MetricsService()
+
+def _response_project(session: Session, response: StandupResponse) -> Any:
+    # The parent session is normally already loaded; don't query from inside a flush
+    standup_session = session.identity_map.get(identity_key(StandupSession, response.session_id))
+    return standup_session.project_id if standup_session is not None else ALL
+
+@on_committed_writes((Ticket, Sprint, StandupSession), key=lambda session, obj: obj.project_id)
+def _project_data_committed(project_ids):
+    for project_id in project_ids:
+        metrics_service.invalidate(project_id)
+
+@on_committed_writes((StandupResponse,), key=_response_project)
+def _responses_committed(project_ids):
+    for project_id in project_ids:
+        metrics_service.invalidate(project_id)
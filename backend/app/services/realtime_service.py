@@ -0,0 +1,200 @@
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional, Set
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import ValidationError
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.database import ASYNC_DATABASE_URI, engine
+from app.models.project import Sprint
+from app.models.standup import StandupSession
+from app.schemas.project import Sprint as SprintSchema
+from app.schemas.standup import StandupSession as StandupSessionSchema
+from app.services.metrics_service import metrics_service
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY channel shared by every worker
+CHANNEL = "tickora_events"
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more. Bigger events are
+# sent without "data"; clients fetch it (for tickets, via the change feed).
+NOTIFY_MAX_PAYLOAD = 7900
+
+_PENDING = "realtime_events"
+
+# Events whose writes change a project's dashboard metrics
+METRICS_EVENT_TYPES = {"ticket", "sprint", "standup_session", "standup_response"}
+
+class RealtimeService:
+    """
+    Per-project event streams for WebSocket clients.
+
+    Events are queued on the writing session and only go out if it commits.
+    On Postgres they are sent with NOTIFY inside that transaction and every
+    worker LISTENs, so subscribers see writes made by any worker or by the
+    scheduler. On other databases (SQLite, tests) delivery is in-process.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listener: Optional[asyncio.Task] = None
+
+    @property
+    def uses_notify(self) -> bool:
+        return engine.dialect.name == "postgresql"
+
+    def publish(self, db: Session, project_id: Any, event: Dict[str, Any]) -> None:
+        """Queue an event for a project's subscribers; it is sent when `db` commits."""
+        db.info.setdefault(_PENDING, []).append(jsonable_encoder({**event, "project_id": project_id}))
+
+    @asynccontextmanager
+    async def subscribe(self, project_id: UUID):
+        self._loop = self._loop or asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=settings.REALTIME_QUEUE_SIZE)
+        key = str(project_id)
+        self._subscribers.setdefault(key, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(key, set())
+            subscribers.discard(queue)
+            if not subscribers:
+                self._subscribers.pop(key, None)
+
+    def deliver(self, event: Dict[str, Any]) -> None:
+        """Hand an event to this process's subscribers; safe to call from any thread."""
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._fan_out, event)
+
+    def _fan_out(self, event: Dict[str, Any]) -> None:
+        for queue in self._subscribers.get(event.get("project_id"), ()):
+            if queue.full():
+                # Slow client: drop its backlog and have it reload instead
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"type": "resync", "project_id": event.get("project_id")})
+            else:
+                queue.put_nowait(event)
+
+    def _resync_all(self) -> None:
+        for project_id in list(self._subscribers):
+            self._fan_out({"type": "resync", "project_id": project_id})
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        if self.uses_notify and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def _listen(self) -> None:
+        # A dedicated connection outside the pool: LISTEN holds it for good
+        listen_engine = create_async_engine(ASYNC_DATABASE_URI, poolclass=NullPool)
+        reconnecting = False
+        try:
+            while True:
+                try:
+                    async with listen_engine.connect() as conn:
+                        raw = await conn.get_raw_connection()
+                        connection = raw.driver_connection
+                        lost = asyncio.Event()
+                        connection.add_termination_listener(lambda _: lost.set())
+                        await connection.add_listener(CHANNEL, self._on_notify)
+                        if reconnecting:
+                            # Anything sent while we were disconnected is gone
+                            metrics_service.invalidate()
+                            self._resync_all()
+                        await lost.wait()
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception("Realtime listener failed")
+                logger.warning("Realtime listener disconnected, reconnecting")
+                reconnecting = True
+                await asyncio.sleep(1)
+        finally:
+            await listen_engine.dispose()
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        event = json.loads(payload)
+        # Every worker hears every process's writes here, so this is also where
+        # their cached dashboards learn that another process changed a project
+        if event.get("type") in METRICS_EVENT_TYPES:
+            metrics_service.invalidate(UUID(event["project_id"]))
+        self._fan_out(event)
+
+realtime_service = RealtimeService()
+
+def _notify_payload(event: Dict[str, Any]) -> str:
+    payload = json.dumps(event, separators=(",", ":"))
+    if len(payload.encode()) > NOTIFY_MAX_PAYLOAD:
+        payload = json.dumps({**{k: v for k, v in event.items() if k != "data"}, "truncated": True})
+    return payload
+
+# Sprint and standup session writes go through the unit of work, so they are
+# picked up from flushes. Ticket events are published with the change log.
+_FLUSH_EVENTS = (
+    (Sprint, "sprint", SprintSchema),
+    (StandupSession, "standup_session", StandupSessionSchema),
+)
+_EVENT_MODELS = tuple(model for model, _, _ in _FLUSH_EVENTS)
+
+def publish_object(session: Session, op: str, obj: Any) -> None:
+    """Publish a sprint or standup session write; bulk statements call this directly."""
+    for model, kind, schema in _FLUSH_EVENTS:
+        if isinstance(obj, model):
+            data = None
+            if op != "deleted":
+                try:
+                    data = schema.from_orm(obj)
+                except ValidationError:
+                    # Rows the API schema can't represent still announce the change
+                    logger.warning(f"Realtime {kind} event for {obj.id} sent without data")
+            realtime_service.publish(session, obj.project_id, {"type": kind, "op": op, "id": obj.id, "data": data})
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed(session, flush_context):
+    for op, objects in (("created", session.new), ("updated", session.dirty), ("deleted", session.deleted)):
+        for obj in objects:
+            if isinstance(obj, _EVENT_MODELS) and (op != "updated" or session.is_modified(obj)):
+                publish_object(session, op, obj)
+
+@event.listens_for(Session, "before_commit")
+def _notify_in_transaction(session):
+    if not realtime_service.uses_notify:
+        return
+    # Commit flushes after this hook; flush now so its events go out too
+    session.flush()
+    events = session.info.pop(_PENDING, None)
+    if events:
+        session.execute(
+            text("SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"),
+            {"channel": CHANNEL, "payloads": [_notify_payload(e) for e in events]},
+        )
+
+@event.listens_for(Session, "after_commit")
+def _deliver_committed(session):
+    for e in session.info.pop(_PENDING, None) or ():
+        realtime_service.deliver(e)
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session):
+    session.info.pop(_PENDING, None)
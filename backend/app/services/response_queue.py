@@ -0,0 +1,299 @@
+import logging
+import queue
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, delete, event, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models.standup import JobStatus, ResponseJob, StandupResponse
+from app.services.standup_service import standup_service
+
+logger = logging.getLogger(__name__)
+
+# A RUNNING job untouched for this long belongs to a worker that died; it is claimed again
+STALE_JOB_SECONDS = 600
+# Finished jobs are kept this long so their status can still be looked up
+DONE_RETENTION = timedelta(days=1)
+PRUNE_INTERVAL = timedelta(hours=1)
+
+_PENDING = "response_queue"
+
+class ResponseQueue:
+    """
+    Processes standup responses (ticket mentions -> status updates) off the
+    request path.
+
+    Responses are enqueued inside the request's transaction and only become
+    visible to the worker once it commits. A worker thread drains them in
+    batches and processes each standup session's responses together in one
+    transaction, retrying failures with exponential backoff.
+
+    In "memory" mode the queue lives in this process: it's cheap, but pending
+    work is lost on restart and status is only known to the worker that took
+    the response. In "database" mode jobs are rows in response_jobs, claimed
+    with FOR UPDATE SKIP LOCKED, so any number of workers can share them and
+    nothing is lost on restart.
+    """
+
+    def __init__(self, mode: str, batch_size: int, max_attempts: int, poll_seconds: float):
+        if mode not in ("memory", "database"):
+            raise ValueError(f"Unknown RESPONSE_QUEUE_MODE {mode!r}")
+        self.mode = mode
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.poll_seconds = poll_seconds
+        self._queue: "queue.Queue[Tuple[UUID, UUID, int]]" = queue.Queue()
+        self._status = TTLCache(int(DONE_RETENTION.total_seconds()), max_entries=100000)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._last_prune = datetime.min
+
+    @property
+    def durable(self) -> bool:
+        return self.mode == "database"
+
+    def enqueue(self, db: Session, response: StandupResponse) -> None:
+        """Queue `response` for processing once `db` commits. The response must be flushed."""
+        if self.durable:
+            already_queued = db.scalar(
+                select(ResponseJob.id).where(
+                    ResponseJob.response_id == response.id,
+                    ResponseJob.status == JobStatus.QUEUED,
+                ).limit(1)
+            )
+            if not already_queued:
+                db.add(ResponseJob(response_id=response.id, session_id=response.session_id))
+        else:
+            db.info.setdefault(_PENDING, []).append((response.id, response.session_id))
+            # Only this process can drain its in-memory queue; durable jobs are
+            # polled by whichever processes run background work
+            self.start()
+
+    def status(self, db: Session, response_id: UUID) -> Optional[Dict[str, Any]]:
+        if not self.durable:
+            return self._status.get(response_id)
+        job = db.scalars(
+            select(ResponseJob)
+            .where(ResponseJob.response_id == response_id)
+            .order_by(ResponseJob.created_at.desc())
+            .limit(1)
+        ).first()
+        if job is None:
+            return None
+        return {
+            "response_id": job.response_id,
+            "status": job.status,
+            "attempts": job.attempts,
+            "last_error": job.last_error,
+            "updated_at": job.updated_at,
+        }
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            target = self._poll_database if self.durable else self._drain_memory
+            self._thread = threading.Thread(target=target, name="response-queue", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+
+    def _process(self, response_ids: List[UUID]) -> None:
+        db = SessionLocal()
+        try:
+            standup_service.process_responses(db, response_ids)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    # In-process queue
+
+    def _committed(self, items: Iterable[Tuple[UUID, UUID]]) -> None:
+        for response_id, session_id in items:
+            self._set_status(response_id, JobStatus.QUEUED, 0)
+            self._queue.put((response_id, session_id, 0))
+
+    def _set_status(self, response_id: UUID, status: JobStatus, attempts: int, error: Optional[str] = None) -> None:
+        self._status.set(response_id, {
+            "response_id": response_id,
+            "status": status,
+            "attempts": attempts,
+            "last_error": error,
+            "updated_at": datetime.utcnow(),
+        })
+
+    def _drain_memory(self) -> None:
+        while not self._stop.is_set():
+            try:
+                batch = [self._queue.get(timeout=self.poll_seconds)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            by_session: Dict[UUID, Dict[UUID, int]] = {}
+            for response_id, session_id, attempts in batch:
+                group = by_session.setdefault(session_id, {})
+                group[response_id] = max(attempts, group.get(response_id, 0))
+
+            for session_id, group in by_session.items():
+                for response_id, attempts in group.items():
+                    self._set_status(response_id, JobStatus.RUNNING, attempts + 1)
+                try:
+                    self._process(list(group))
+                except Exception as e:
+                    logger.error(f"Error processing standup responses for session {session_id}: {e}")
+                    for response_id, attempts in group.items():
+                        self._retry_in_memory(response_id, session_id, attempts + 1, repr(e))
+                else:
+                    for response_id, attempts in group.items():
+                        self._set_status(response_id, JobStatus.DONE, attempts + 1)
+
+    def _retry_in_memory(self, response_id: UUID, session_id: UUID, attempts: int, error: str) -> None:
+        if attempts >= self.max_attempts:
+            self._set_status(response_id, JobStatus.FAILED, attempts, error)
+            return
+        self._set_status(response_id, JobStatus.QUEUED, attempts, error)
+        timer = threading.Timer(2 ** attempts, self._queue.put, args=((response_id, session_id, attempts),))
+        timer.daemon = True
+        timer.start()
+
+    # Durable queue
+
+    def _poll_database(self) -> None:
+        while not self._stop.is_set():
+            try:
+                jobs = self._claim()
+                if jobs:
+                    self._run_jobs(jobs)
+                self._prune()
+            except Exception as e:
+                logger.error(f"Error in response queue poller: {e}")
+                jobs = None
+            # Keep draining while there's a backlog; otherwise wait for the next poll
+            if not jobs or len(jobs) < self.batch_size:
+                self._stop.wait(self.poll_seconds)
+
+    def _claim(self) -> List[Any]:
+        now = datetime.utcnow()
+        due = (
+            select(ResponseJob.id)
+            .where(or_(
+                and_(ResponseJob.status == JobStatus.QUEUED, ResponseJob.run_after <= now),
+                and_(
+                    ResponseJob.status == JobStatus.RUNNING,
+                    ResponseJob.updated_at < now - timedelta(seconds=STALE_JOB_SECONDS),
+                ),
+            ))
+            .order_by(ResponseJob.run_after)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        db = SessionLocal()
+        try:
+            jobs = db.execute(
+                update(ResponseJob)
+                .where(ResponseJob.id.in_(due))
+                .values(status=JobStatus.RUNNING, attempts=ResponseJob.attempts + 1, updated_at=now)
+                .returning(ResponseJob.id, ResponseJob.response_id, ResponseJob.session_id, ResponseJob.attempts)
+                .execution_options(synchronize_session=False)
+            ).all()
+            db.commit()
+            return jobs
+        finally:
+            db.close()
+
+    def _run_jobs(self, jobs: List[Any]) -> None:
+        by_session: Dict[UUID, List[Any]] = {}
+        for job in jobs:
+            by_session.setdefault(job.session_id, []).append(job)
+
+        for session_id, group in by_session.items():
+            error = None
+            try:
+                self._process(list({job.response_id for job in group}))
+            except Exception as e:
+                logger.error(f"Error processing standup responses for session {session_id}: {e}")
+                error = repr(e)
+            self._finish(group, error)
+
+    def _finish(self, jobs: List[Any], error: Optional[str]) -> None:
+        now = datetime.utcnow()
+        db = SessionLocal()
+        try:
+            if error is None:
+                db.execute(
+                    update(ResponseJob)
+                    .where(ResponseJob.id.in_([job.id for job in jobs]))
+                    .values(status=JobStatus.DONE, last_error=None, updated_at=now)
+                    .execution_options(synchronize_session=False)
+                )
+            else:
+                for job in jobs:
+                    gave_up = job.attempts >= self.max_attempts
+                    db.execute(
+                        update(ResponseJob)
+                        .where(ResponseJob.id == job.id)
+                        .values(
+                            status=JobStatus.FAILED if gave_up else JobStatus.QUEUED,
+                            run_after=now + timedelta(seconds=2 ** job.attempts),
+                            last_error=error,
+                            updated_at=now,
+                        )
+                        .execution_options(synchronize_session=False)
+                    )
+            db.commit()
+        finally:
+            db.close()
+
+    def _prune(self) -> None:
+        now = datetime.utcnow()
+        if now - self._last_prune < PRUNE_INTERVAL:
+            return
+        self._last_prune = now
+        db = SessionLocal()
+        try:
+            db.execute(
+                delete(ResponseJob)
+                .where(ResponseJob.status == JobStatus.DONE, ResponseJob.updated_at < now - DONE_RETENTION)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        finally:
+            db.close()
+
+response_queue = ResponseQueue(
+    mode=settings.RESPONSE_QUEUE_MODE,
+    batch_size=settings.RESPONSE_QUEUE_BATCH_SIZE,
+    max_attempts=settings.RESPONSE_QUEUE_MAX_ATTEMPTS,
+    poll_seconds=settings.RESPONSE_QUEUE_POLL_SECONDS,
+)
+
+@event.listens_for(Session, "after_commit")
+def _hand_over_committed(session):
+    items = session.info.pop(_PENDING, None)
+    if items:
+        response_queue._committed(items)
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session):
+    session.info.pop(_PENDING, None)
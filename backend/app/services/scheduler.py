@@ -1,75 +1,185 @@
+import functools
 import logging
-import pytz
-from datetime import datetime, time
+import threading
+from datetime import datetime, timedelta
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.database import SessionLocal
-from app.models.standup import StandupConfig, StandupSession, SessionStatus
+from app.db.leader import LeaderElection
+from app.models.standup import StandupConfig
 from app.services.standup_service import standup_service
+from app.services.sprint_service import sprint_service
+from app.services.summary_worker import summary_worker
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 scheduler = BackgroundScheduler()
 
+# Jobs must not run on two processes at once, so a deposed leader waits for its
+# running jobs to finish before giving up the lock
+_jobs = threading.Condition()
+_jobs_running = 0
+_jobs_paused = True
+
+def _leader_job(fn):
+    """Run `fn` only while this process leads, and count it as running meanwhile."""
+    @functools.wraps(fn)
+    def run():
+        global _jobs_running
+        with _jobs:
+            # A run the executor had already picked up when we were deposed
+            if _jobs_paused:
+                return
+            _jobs_running += 1
+        try:
+            fn()
+        finally:
+            with _jobs:
+                _jobs_running -= 1
+                _jobs.notify_all()
+    return run
+
+# Due configs handled per query; the job keeps going until none are due
+DUE_CONFIG_BATCH_SIZE = 500
+
+@_leader_job
 def create_daily_sessions():
-    """Check all active configs and create sessions if it's the right time and day."""
+    """Start sessions for configs whose next fire time has passed and schedule their next one."""
     db: Session = SessionLocal()
     try:
-        configs = db.query(StandupConfig).filter(StandupConfig.is_active == True).all()
-        
-        for config in configs:
-            try:
-                tz = pytz.timezone(config.timezone or "UTC")
-            except pytz.UnknownTimeZoneError:
-                logger.warning(f"Invalid timezone {config.timezone} for project {config.project_id}, falling back to UTC")
-                tz = pytz.UTC
-                
-            local_now = datetime.now(tz)
-            day_name = local_now.strftime("%a")
-            
-            if day_name not in (config.working_days or []):
-                continue
-                
-            current_time_str = local_now.strftime("%H:%M")
-            
-            # If current local time matches the config time
-            if current_time_str == config.time:
-                standup_service.create_session(db, config.id)
-                
+        now = datetime.utcnow()
+
+        # New or migrated configs that haven't been scheduled yet. Ones that can
+        # never fire get NEVER_FIRES, so they aren't picked up here again.
+        unscheduled = db.query(StandupConfig).filter(
+            StandupConfig.is_active == True,
+            StandupConfig.next_fire_at.is_(None)
+        ).all()
+        for config in unscheduled:
+            standup_service.schedule(config, now)
+        db.commit()
+
+        while True:
+            due = db.query(StandupConfig).filter(
+                StandupConfig.is_active == True,
+                StandupConfig.next_fire_at <= now
+            ).order_by(StandupConfig.next_fire_at).limit(DUE_CONFIG_BATCH_SIZE).all()
+            if not due:
+                break
+
+            for config in due:
+                config_id, fire_at = config.id, config.next_fire_at
+                # Fires missed while we were down still run if their response window is open
+                window_open = fire_at + timedelta(hours=config.response_window_hours or 0) > now
+                next_fire_at = standup_service.schedule(config, now)
+                try:
+                    if window_open:
+                        # Commits the new next_fire_at together with the session
+                        standup_service.create_session(db, config_id, started_at=fire_at)
+                    else:
+                        logger.warning(f"Skipped standup for config {config_id} due at {fire_at}: response window already over")
+                        db.commit()
+                except Exception as e:
+                    db.rollback()
+                    logger.error(f"Error creating standup session for config {config_id}: {e}")
+                    # Still move on so one broken config can't hold up the queue
+                    db.query(StandupConfig).filter(StandupConfig.id == config_id).update(
+                        {StandupConfig.next_fire_at: next_fire_at}, synchronize_session=False
+                    )
+                    db.commit()
+
     except Exception as e:
         logger.error(f"Error in create_daily_sessions: {e}")
     finally:
         db.close()
 
+# How far back the close job looks for closed sessions still missing a summary
+SUMMARY_RECOVERY_HOURS = 24
+
+@_leader_job
 def close_expired_sessions():
-    """Close sessions that have passed their response window and generate summary."""
+    """Close all expired sessions at once and queue their summaries on the worker pool."""
     db: Session = SessionLocal()
     try:
         now_utc = datetime.utcnow()
-        expired = db.query(StandupSession).filter(
-            StandupSession.status == SessionStatus.ACTIVE,
-            StandupSession.ends_at <= now_utc
-        ).all()
-        
-        for session in expired:
-            standup_service.close_session(db, session.id)
+        closed = standup_service.close_expired_sessions(db, now_utc)
+        db.commit()
+        if closed:
+            logger.info(f"Closed {len(closed)} standup sessions")
+
+        # Includes the sessions just closed, plus any whose summary failed or was
+        # lost to a restart; the worker skips ones it already has queued
+        pending = standup_service.sessions_missing_summary(db, now_utc - timedelta(hours=SUMMARY_RECOVERY_HOURS))
+        summary_worker.submit(pending)
             
     except Exception as e:
+        db.rollback()
         logger.error(f"Error in close_expired_sessions: {e}")
     finally:
         db.close()
 
+@_leader_job
+def record_sprint_snapshots():
+    """Upsert today's burndown snapshot for every active sprint."""
+    db: Session = SessionLocal()
+    try:
+        count = sprint_service.record_snapshots(db)
+        db.commit()
+        logger.info(f"Recorded {count} sprint snapshots")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error in record_sprint_snapshots: {e}")
+    finally:
+        db.close()
+
+# Advisory lock key shared by every process of a deployment ("tickora" in ASCII)
+SCHEDULER_LOCK_KEY = 0x7469636B6F7261
+
+def _resume_jobs():
+    global _jobs_paused
+    with _jobs:
+        _jobs_paused = False
+    scheduler.resume()
+    logger.info("Scheduled jobs resumed on this process.")
+
+def _pause_jobs():
+    """Stop scheduling jobs and return once none are running."""
+    global _jobs_paused
+    with _jobs:
+        _jobs_paused = True
+    scheduler.pause()
+    with _jobs:
+        while _jobs_running:
+            logger.info(f"Waiting for {_jobs_running} running scheduled jobs before stepping down.")
+            _jobs.wait(30)
+    logger.info("Scheduled jobs paused on this process.")
+
+leader = LeaderElection(
+    "scheduler",
+    key=SCHEDULER_LOCK_KEY,
+    on_elected=_resume_jobs,
+    on_deposed=_pause_jobs,
+    retry_seconds=settings.SCHEDULER_LEADER_RETRY_SECONDS,
+)
+
 def start_scheduler():
     if not scheduler.running:
         # Runs every minute as requested
         scheduler.add_job(create_daily_sessions, CronTrigger(second="0"), id="create_sessions")
         scheduler.add_job(close_expired_sessions, CronTrigger(second="30"), id="close_sessions")
-        scheduler.start()
+        # Hourly so today's snapshot stays current; each run overwrites today's row
+        scheduler.add_job(record_sprint_snapshots, CronTrigger(minute="55"), id="sprint_snapshots")
+        # Jobs stay paused until this process is elected leader
+        scheduler.start(paused=True)
+        leader.start()
         logger.info("APScheduler started.")
 
 def stop_scheduler():
     if scheduler.running:
+        leader.stop()
         scheduler.shutdown()
+        summary_worker.shutdown()
         logger.info("APScheduler stopped.")
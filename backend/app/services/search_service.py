@@ -0,0 +1,129 @@
+import re
+import math
+import threading
+from uuid import UUID
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.events import on_committed_writes
+from app.models.project import Ticket, TicketStatus, TicketPriority
+
+SEARCH_CONFIG = "english"
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return re.findall(r"[a-z0-9]+", (text or "").lower())
+
+class InvertedIndex:
+    """
+    In-memory BM25 index over ticket title/description.
+    Used where Postgres full-text search isn't available (SQLite test runs).
+    Title terms count double, mirroring the A/B weights of the tsvector column.
+    """
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[UUID, int]] = {}
+        self.docs: Dict[UUID, Tuple[UUID, TicketStatus, TicketPriority, int]] = {}
+
+    def add(self, ticket_id: UUID, title: str, description: str, project_id: UUID,
+            status: TicketStatus, priority: TicketPriority) -> None:
+        terms = Counter(tokenize(title) * 2 + tokenize(description))
+        for term, tf in terms.items():
+            self.postings.setdefault(term, {})[ticket_id] = tf
+        self.docs[ticket_id] = (project_id, status, priority, sum(terms.values()))
+
+    def search(self, q: str, project_id: Optional[UUID] = None, status: Optional[TicketStatus] = None,
+               priority: Optional[TicketPriority] = None) -> List[Tuple[UUID, float]]:
+        terms = set(tokenize(q))
+        if not terms or not self.docs:
+            return []
+        # All terms must match, like websearch_to_tsquery's implicit AND
+        postings = [self.postings.get(term, {}) for term in terms]
+        candidates = set.intersection(*(set(p) for p in postings))
+        avg_len = sum(d[3] for d in self.docs.values()) / len(self.docs)
+        n = len(self.docs)
+        ranked = []
+        for ticket_id in candidates:
+            doc_project, doc_status, doc_priority, length = self.docs[ticket_id]
+            if project_id and doc_project != project_id:
+                continue
+            if status and doc_status != status:
+                continue
+            if priority and doc_priority != priority:
+                continue
+            score = 0.0
+            for term_postings in postings:
+                tf = term_postings[ticket_id]
+                idf = math.log(1 + (n - len(term_postings) + 0.5) / (len(term_postings) + 0.5))
+                score += idf * tf * (self.K1 + 1) / (tf + self.K1 * (1 - self.B + self.B * length / avg_len))
+            ranked.append((ticket_id, score))
+        ranked.sort(key=lambda item: (-item[1], str(item[0])))
+        return ranked
+
+class SearchService:
+    def __init__(self):
+        self._index: Optional[InvertedIndex] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def mark_stale(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._index = None
+
+    async def search(
+        self,
+        db: AsyncSession,
+        q: str,
+        project_id: Optional[UUID] = None,
+        status: Optional[TicketStatus] = None,
+        priority: Optional[TicketPriority] = None,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> List[Tuple[Ticket, float]]:
+        if db.bind.dialect.name == "postgresql":
+            return await self._search_postgres(db, q, project_id, status, priority, skip, limit)
+        return await self._search_fallback(db, q, project_id, status, priority, skip, limit)
+
+    async def _search_postgres(self, db, q, project_id, status, priority, skip, limit):
+        query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+        rank = func.ts_rank_cd(Ticket.search_vector, query).label("rank")
+        stmt = select(Ticket, rank).where(Ticket.search_vector.op("@@")(query))
+        if project_id:
+            stmt = stmt.where(Ticket.project_id == project_id)
+        if status:
+            stmt = stmt.where(Ticket.status == status)
+        if priority:
+            stmt = stmt.where(Ticket.priority == priority)
+        result = await db.execute(stmt.order_by(rank.desc(), Ticket.id).offset(skip).limit(limit))
+        return [(ticket, float(score)) for ticket, score in result.all()]
+
+    async def _search_fallback(self, db, q, project_id, status, priority, skip, limit):
+        index = self._index
+        if index is None:
+            generation = self._generation
+            rows = (await db.execute(select(
+                Ticket.id, Ticket.title, Ticket.description, Ticket.project_id, Ticket.status, Ticket.priority
+            ))).all()
+            index = InvertedIndex()
+            for row in rows:
+                index.add(*row)
+            with self._lock:
+                # Don't cache an index that a concurrent write already made stale
+                if self._generation == generation:
+                    self._index = index
+        page = index.search(q, project_id, status, priority)[skip:skip + limit]
+        if not page:
+            return []
+        tickets = (await db.execute(select(Ticket).where(Ticket.id.in_([t for t, _ in page])))).scalars().all()
+        by_id = {t.id: t for t in tickets}
+        return [(by_id[t], score) for t, score in page if t in by_id]
+
+search_service = SearchService()
+
+# The fallback index is rebuilt lazily after any committed ticket write
+@on_committed_writes((Ticket,))
+def _tickets_committed(keys):
+    search_service.mark_stale()
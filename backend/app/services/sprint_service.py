@@ -0,0 +1,114 @@
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import Date, DateTime, case, func, literal, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.project import Sprint, SprintSnapshot, SprintStatus, Ticket, TicketChangeOp, TicketStatus
+from app.services.ticket_service import ticket_service
+
+logger = logging.getLogger(__name__)
+
+class SprintService:
+    def record_snapshots(self, db: Session, sprint_ids: Optional[List[UUID]] = None, day: Optional[date] = None) -> int:
+        """
+        Upsert today's totals for every active sprint (or just `sprint_ids`) in one
+        INSERT ... SELECT ... ON CONFLICT. Re-running on the same day overwrites
+        that day's row, so the last run of the day wins.
+        """
+        day = day or datetime.utcnow().date()
+        done_points = case((Ticket.status == TicketStatus.DONE, Ticket.points), else_=0)
+        totals = select(
+            Sprint.id,
+            literal(day, Date),
+            func.coalesce(func.sum(Ticket.points), 0),
+            func.coalesce(func.sum(done_points), 0),
+            func.coalesce(func.sum(Ticket.points), 0) - func.coalesce(func.sum(done_points), 0),
+            func.count(Ticket.id),
+            func.count(case((Ticket.status == TicketStatus.DONE, Ticket.id))),
+            literal(datetime.utcnow(), DateTime),
+        ).outerjoin(Ticket, Ticket.sprint_id == Sprint.id).group_by(Sprint.id)
+        if sprint_ids is None:
+            totals = totals.where(Sprint.status == SprintStatus.ACTIVE)
+        else:
+            totals = totals.where(Sprint.id.in_(sprint_ids))
+
+        dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+        columns = [
+            "sprint_id", "day", "committed_points", "completed_points",
+            "remaining_points", "ticket_count", "done_count", "recorded_at",
+        ]
+        stmt = dialect.insert(SprintSnapshot).from_select(columns, totals)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["sprint_id", "day"],
+            set_={c: getattr(stmt.excluded, c) for c in columns[2:]},
+        )
+        return db.execute(stmt).rowcount
+
+    def close_sprint(self, db: Session, sprint: Sprint, target: Optional[Sprint]) -> Tuple[int, int]:
+        """
+        Mark `sprint` completed and carry its unfinished tickets over to `target`
+        (or the backlog) with one UPDATE ... RETURNING. The final snapshot is taken
+        first so velocity still sees what was committed. Returns (moved, completed)
+        ticket counts; the caller commits.
+        """
+        self.record_snapshots(db, [sprint.id])
+        moved = db.scalars(
+            update(Ticket)
+            .where(
+                Ticket.sprint_id == sprint.id,
+                or_(Ticket.status != TicketStatus.DONE, Ticket.status.is_(None)),
+            )
+            .values(sprint_id=target.id if target else None, updated_at=datetime.utcnow())
+            .returning(Ticket)
+            .execution_options(synchronize_session=False)
+        ).all()
+        ticket_service.record_changes(db, [(TicketChangeOp.UPDATED, ticket) for ticket in moved])
+        completed = db.scalar(select(func.count(Ticket.id)).where(Ticket.sprint_id == sprint.id))
+        sprint.status = SprintStatus.COMPLETED
+        return len(moved), completed
+
+    async def burndown(self, db: AsyncSession, sprint_id: UUID) -> List[SprintSnapshot]:
+        result = await db.execute(
+            select(SprintSnapshot).where(SprintSnapshot.sprint_id == sprint_id).order_by(SprintSnapshot.day)
+        )
+        return result.scalars().all()
+
+    async def velocity(self, db: AsyncSession, project_id: UUID, sprints: int) -> Dict[str, Any]:
+        """Completed vs committed points of the last `sprints` completed sprints, from their final snapshots."""
+        recent = select(Sprint.id, Sprint.name, Sprint.end_date, Sprint.created_at).where(
+            Sprint.project_id == project_id,
+            Sprint.status == SprintStatus.COMPLETED,
+        ).order_by(Sprint.end_date.desc().nulls_last(), Sprint.created_at.desc()).limit(sprints).subquery("recent")
+        last_day = select(
+            SprintSnapshot.sprint_id, func.max(SprintSnapshot.day).label("day")
+        ).where(SprintSnapshot.sprint_id.in_(select(recent.c.id))).group_by(SprintSnapshot.sprint_id).subquery("last_day")
+
+        rows = (await db.execute(
+            select(
+                recent.c.id, recent.c.name, recent.c.end_date,
+                SprintSnapshot.committed_points, SprintSnapshot.completed_points,
+            )
+            .outerjoin(last_day, last_day.c.sprint_id == recent.c.id)
+            .outerjoin(SprintSnapshot, (SprintSnapshot.sprint_id == last_day.c.sprint_id) & (SprintSnapshot.day == last_day.c.day))
+            .order_by(recent.c.end_date.desc().nulls_last(), recent.c.created_at.desc())
+        )).all()
+
+        history = [
+            {
+                "sprint_id": row.id,
+                "name": row.name,
+                "end_date": row.end_date,
+                "committed_points": row.committed_points or 0,
+                "completed_points": row.completed_points or 0,
+            }
+            for row in rows
+        ]
+        average = sum(h["completed_points"] for h in history) / len(history) if history else 0.0
+        return {"project_id": project_id, "average_velocity": average, "sprints": history}
+
+sprint_service = SprintService()
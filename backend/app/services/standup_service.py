@@ -1,24 +1,103 @@
-import re
 import logging
+import threading
+import pytz
+from concurrent.futures import Future
 from uuid import UUID
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from typing import List, Optional, Tuple
-from sqlalchemy.orm import Session
-from app.models.standup import StandupConfig, StandupSession, StandupResponse, StandupSummary, SessionStatus
-from app.models.project import Ticket, TicketStatus, Project, ProjectMember
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session, joinedload, selectinload
+from app.core.config import settings
+from app.models.standup import NEVER_FIRES, StandupConfig, StandupSession, StandupResponse, StandupSummary, SessionStatus
+from app.models.project import Ticket, TicketStatus, TicketChangeOp, Project, ProjectMember
 from app.services.ai_service import ai_service
+from app.services.ticket_matcher import ticket_matcher
+from app.services.ticket_service import ticket_service
+from app.services.realtime_service import publish_object
 from app.database import SessionLocal
 
 logger = logging.getLogger(__name__)
 
+# AI calls made with a timeout each get their own thread, so the caller can stop
+# waiting and no call queues behind a hung one. A timed-out call keeps its thread
+# until it returns; with this many still running, new calls fail straight away
+# rather than pile up more abandoned work.
+_ai_call_slots = threading.BoundedSemaphore(2 * settings.STANDUP_SUMMARY_MAX_WORKERS)
+
+def _call_ai(fn, prompt: str, timeout: float):
+    if not _ai_call_slots.acquire(blocking=False):
+        raise TimeoutError("Too many AI calls still running")
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(fn(prompt))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            _ai_call_slots.release()
+
+    threading.Thread(target=run, name="standup-ai", daemon=True).start()
+    # Raises TimeoutError; a late result is simply dropped
+    return future.result(timeout=timeout)
+
+# Statuses a ticket mention may set, by the response field it appears in. Plans
+# for today don't complete anything, and a blocker mention changes nothing.
+RESPONSE_STATUS_FIELDS = {
+    "yesterday": {TicketStatus.DONE, TicketStatus.REVIEW, TicketStatus.IN_PROGRESS},
+    "today": {TicketStatus.REVIEW, TicketStatus.IN_PROGRESS},
+    "blockers": set(),
+}
+
 class StandupService:
-    def create_session(self, db: Session, config_id: UUID) -> StandupSession:
+    def next_fire_time(self, config: StandupConfig, after: datetime) -> Optional[datetime]:
+        """
+        First session start strictly after `after`, both naive UTC. Worked out in
+        the config's timezone so it follows DST: a time skipped by a spring-forward
+        gap fires an hour later, and a time repeated by fall-back fires once.
+        Returns None when the config can never fire (no working days, bad time).
+        """
+        try:
+            tz = pytz.timezone(config.timezone or "UTC")
+        except pytz.UnknownTimeZoneError:
+            logger.warning(f"Invalid timezone {config.timezone} for project {config.project_id}, falling back to UTC")
+            tz = pytz.UTC
+        try:
+            hour, minute = (int(part) for part in (config.time or "").split(":"))
+            fire_time = time(hour, minute)
+        except ValueError:
+            return None
+
+        working_days = set(config.working_days or [])
+        local_after = pytz.UTC.localize(after).astimezone(tz)
+        for offset in range(8):
+            day = local_after.date() + timedelta(days=offset)
+            if day.strftime("%a") not in working_days:
+                continue
+            naive = datetime.combine(day, fire_time)
+            try:
+                local = tz.localize(naive, is_dst=None)
+            except pytz.AmbiguousTimeError:
+                local = tz.localize(naive, is_dst=True)
+            except pytz.NonExistentTimeError:
+                local = tz.normalize(tz.localize(naive, is_dst=False))
+            fire_at = local.astimezone(pytz.UTC).replace(tzinfo=None)
+            if fire_at > after:
+                return fire_at
+        return None
+
+    def schedule(self, config: StandupConfig, after: datetime) -> datetime:
+        """Set and return the config's next fire time after `after`, or NEVER_FIRES."""
+        config.next_fire_at = self.next_fire_time(config, after) or NEVER_FIRES
+        return config.next_fire_at
+
+    def create_session(self, db: Session, config_id: UUID, started_at: Optional[datetime] = None) -> StandupSession:
         config = db.query(StandupConfig).get(config_id)
         if not config:
             raise ValueError("Standup config not found")
         
         # Check if session already exists for this config on the same day
-        now = datetime.utcnow()
+        now = started_at or datetime.utcnow()
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         existing = db.query(StandupSession).filter(
             StandupSession.config_id == config_id,
@@ -27,6 +106,7 @@ class StandupService:
         
         if existing:
             logger.info(f"Session already exists for config {config_id} today")
+            db.commit()
             return existing
             
         ends_at = now + timedelta(hours=config.response_window_hours)
@@ -55,37 +135,80 @@ class StandupService:
         self.generate_standup_summary(db, session_id)
         logger.info(f"Closed standup session {session_id}")
 
+    def close_expired_sessions(self, db: Session, now: datetime) -> List[UUID]:
+        """Close every active session past its window with one UPDATE ... RETURNING; the caller commits."""
+        closed = db.scalars(
+            update(StandupSession)
+            .where(StandupSession.status == SessionStatus.ACTIVE, StandupSession.ends_at <= now)
+            .values(status=SessionStatus.CLOSED)
+            .returning(StandupSession)
+        ).all()
+        for session in closed:
+            publish_object(db, "updated", session)
+        return [session.id for session in closed]
+
+    def sessions_missing_summary(self, db: Session, closed_since: datetime) -> List[UUID]:
+        """Recently closed sessions whose summary was never written (failed, or lost to a restart)."""
+        return db.scalars(
+            select(StandupSession.id)
+            .outerjoin(StandupSummary, StandupSummary.session_id == StandupSession.id)
+            .where(
+                StandupSession.status == SessionStatus.CLOSED,
+                StandupSession.ends_at >= closed_since,
+                StandupSummary.id.is_(None),
+            )
+        ).all()
+
     def process_response(self, db: Session, response_id: UUID):
-        response = db.query(StandupResponse).get(response_id)
-        if not response:
-            return
-            
-        # Extract ticket IDs (e.g., TICK-123)
-        text = f"{response.yesterday} {response.today} {response.blockers}"
-        ticket_ids = re.findall(r'[A-Z]+-\d+', text)
-        
-        for t_id in set(ticket_ids):
-            ticket = db.query(Ticket).filter(Ticket.title.contains(t_id)).first()
-            if ticket:
-                # Add comment logic (assuming a TicketComment model or similar, 
-                # but for now we'll just simulate or use description if allowed)
-                # For now, let's just log it as the request mentioned "Add comment"
-                logger.info(f"Found ticket {t_id} in standup response {response_id}. Updating via automation.")
-                
-                # Simple status update logic
-                lower_text = text.lower()
-                if "completed" in lower_text or "done" in lower_text:
-                    if t_id in response.yesterday.upper():
-                        ticket.status = TicketStatus.DONE
-                elif "in progress" in lower_text or "started" in lower_text:
-                    if t_id in response.today.upper():
-                        ticket.status = TicketStatus.IN_PROGRESS
-        
+        self.process_responses(db, [response_id])
         db.commit()
 
-    def generate_standup_summary(self, db: Session, session_id: UUID) -> StandupSummary:
-        session = db.query(StandupSession).get(session_id)
-        responses = db.query(StandupResponse).filter(StandupResponse.session_id == session_id).all()
+    def process_responses(self, db: Session, response_ids: List[UUID]) -> None:
+        """
+        Apply ticket updates mentioned in a batch of standup responses: one
+        matcher pass over each field, then one UPDATE per project. Responses
+        are applied in submission order, so a later mention of a ticket wins.
+        The caller commits.
+        """
+        responses = (
+            db.query(StandupResponse)
+            .options(joinedload(StandupResponse.session))
+            .filter(StandupResponse.id.in_(response_ids))
+            .order_by(StandupResponse.created_at)
+            .all()
+        )
+        by_project = {}
+        for response in responses:
+            by_project.setdefault(response.session.project_id, []).append(response)
+
+        changed = []
+        for project_id, project_responses in by_project.items():
+            matcher = ticket_matcher.for_project(db, project_id)
+            statuses = {}
+            for response in project_responses:
+                for field in RESPONSE_STATUS_FIELDS:
+                    for ref in matcher.find(field, getattr(response, field)):
+                        logger.info(f"Found ticket {ref.key} in {field} of standup response {response.id}.")
+                        if ref.status in RESPONSE_STATUS_FIELDS[field]:
+                            statuses[ref.key] = ref.status
+            changed.extend(ticket_service.set_statuses(db, project_id, statuses))
+
+        ticket_service.record_changes(db, [(TicketChangeOp.UPDATED, ticket) for ticket in changed])
+
+    def generate_standup_summary(self, db: Session, session_id: UUID, timeout: Optional[float] = None) -> StandupSummary:
+        existing = db.query(StandupSummary).filter(StandupSummary.session_id == session_id).first()
+        if existing:
+            return existing
+
+        # Fixed number of queries however big the team: responses with their
+        # users, then the project with its owner and members' users
+        responses = (
+            db.query(StandupResponse)
+            .options(joinedload(StandupResponse.user))
+            .filter(StandupResponse.session_id == session_id)
+            .order_by(StandupResponse.created_at)
+            .all()
+        )
         
         if not responses:
             summary_text = "No responses received for this standup session."
@@ -94,35 +217,45 @@ class StandupService:
             db.commit()
             return summary
 
+        project = (
+            db.query(Project)
+            .join(StandupSession, StandupSession.project_id == Project.id)
+            .filter(StandupSession.id == session_id)
+            .options(joinedload(Project.owner), selectinload(Project.members).joinedload(ProjectMember.user))
+            .first()
+        )
+
         # Prepare AI prompt
-        prompt = "Summarize the following standup responses.\nFormat:\n1. 🔴 Blockers (highlight urgent)\n2. 🟡 In Progress\n3. 🟢 Completed Yesterday\n4. ⚠ No Response\nKeep summary concise and professional.\n\nResponses:\n"
-        
-        responders = []
+        lines = ["Summarize the following standup responses.\nFormat:\n1. 🔴 Blockers (highlight urgent)\n2. 🟡 In Progress\n3. 🟢 Completed Yesterday\n4. ⚠ No Response\nKeep summary concise and professional.\n\nResponses:\n"]
         for r in responses:
             user = r.user
-            responders.append(user.id)
-            prompt += f"- User: {user.full_name or user.email}\n"
-            prompt += f"  Yesterday: {r.yesterday}\n"
-            prompt += f"  Today: {r.today}\n"
-            prompt += f"  Blockers: {r.blockers}\n\n"
+            lines.append(
+                f"- User: {user.full_name or user.email}\n"
+                f"  Yesterday: {r.yesterday}\n"
+                f"  Today: {r.today}\n"
+                f"  Blockers: {r.blockers}\n\n"
+            )
+        prompt = "".join(lines)
 
         # Identify non-responders based on ProjectMember table
-        project_members = db.query(ProjectMember).filter(ProjectMember.project_id == session.project_id).all()
         responded_user_ids = {r.user_id for r in responses}
+        project_members = project.members if project else []
         
-        non_responders = []
-        for pm in project_members:
-            if pm.user_id not in responded_user_ids:
-                user = pm.user
-                non_responders.append(user.full_name or user.email)
+        non_responders = [
+            pm.user.full_name or pm.user.email
+            for pm in project_members
+            if pm.user_id not in responded_user_ids
+        ]
         
         # Add project owner if not already in list and didn't respond
-        project = db.query(Project).get(session.project_id)
         if project and project.owner_id not in responded_user_ids:
             if project.owner_id not in {pm.user_id for pm in project_members}:
                 non_responders.append(project.owner.full_name or project.owner.email)
 
-        ai_result = ai_service.generate_summary(prompt)
+        if timeout is None:
+            ai_result = ai_service.generate_summary(prompt)
+        else:
+            ai_result = _call_ai(ai_service.generate_summary, prompt, timeout)
         
         if non_responders:
             ai_result["summary_text"] += f"\n\n⚠ No Response:\n- " + "\n- ".join(non_responders)
@@ -0,0 +1,75 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+from uuid import UUID
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.database import SessionLocal
+from app.services.standup_service import standup_service
+
+logger = logging.getLogger(__name__)
+
+# Sessions that used up their attempts wait this long before the close job retries them
+GAVE_UP_COOLDOWN_SECONDS = 3600
+
+class SummaryWorker:
+    """
+    Generates standup summaries on a bounded thread pool.
+
+    Each session gets its own DB session and its own attempts, so one slow or
+    failing summary never holds up another team's. Attempts are retried with
+    exponential backoff and the AI call is bounded by a timeout.
+    """
+
+    def __init__(self, max_workers: int, timeout: float, max_attempts: int):
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="standup-summary")
+        self._in_flight = set()
+        self._gave_up = TTLCache(GAVE_UP_COOLDOWN_SECONDS, max_entries=100000)
+        self._lock = threading.Lock()
+
+    def submit(self, session_ids: Iterable[UUID]) -> int:
+        """Queue summaries, skipping sessions already queued or cooling down. Returns how many were queued."""
+        queued = 0
+        for session_id in session_ids:
+            with self._lock:
+                if session_id in self._in_flight or self._gave_up.get(session_id):
+                    continue
+                self._in_flight.add(session_id)
+            self._pool.submit(self._run, session_id)
+            queued += 1
+        return queued
+
+    def _run(self, session_id: UUID) -> None:
+        try:
+            for attempt in range(1, self.max_attempts + 1):
+                db = SessionLocal()
+                try:
+                    standup_service.generate_standup_summary(db, session_id, timeout=self.timeout)
+                    logger.info(f"Generated summary for standup session {session_id}")
+                    return
+                except Exception as e:
+                    db.rollback()
+                    logger.warning(f"Summary attempt {attempt}/{self.max_attempts} for session {session_id} failed: {e!r}")
+                finally:
+                    db.close()
+                if attempt < self.max_attempts:
+                    time.sleep(2 ** attempt)
+            logger.error(f"Giving up on summary for session {session_id} for now")
+            self._gave_up.set(session_id, True)
+        finally:
+            with self._lock:
+                self._in_flight.discard(session_id)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+summary_worker = SummaryWorker(
+    max_workers=settings.STANDUP_SUMMARY_MAX_WORKERS,
+    timeout=settings.STANDUP_SUMMARY_TIMEOUT_SECONDS,
+    max_attempts=settings.STANDUP_SUMMARY_MAX_ATTEMPTS,
+)
@@ -0,0 +1,168 @@
+import logging
+import re
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import and_, select
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.models.project import Project, Ticket, TicketChange, TicketStatus
+
+logger = logging.getLogger(__name__)
+
+# Phrases people use in standups, mapped to the status they describe. Negated
+# forms map to None so "not done" doesn't read as "done".
+STATUS_PHRASES: Dict[str, Optional[TicketStatus]] = {
+    **dict.fromkeys([
+        "done", "completed", "complete", "finished", "closed", "merged",
+        "shipped", "resolved", "fixed", "wrapped up",
+    ], TicketStatus.DONE),
+    **dict.fromkeys([
+        "in review", "ready for review", "up for review", "opened a pr", "raised a pr",
+    ], TicketStatus.REVIEW),
+    **dict.fromkeys([
+        "in progress", "started", "start", "starting", "working on", "work on", "worked on",
+        "continue", "continuing", "picked up", "pick up", "picking up",
+    ], TicketStatus.IN_PROGRESS),
+    **dict.fromkeys([
+        "not done", "not yet done", "not finished", "not completed", "not started",
+        "didn't finish", "didn't start",
+    ], None),
+}
+
+# Longest first so "not done" wins over "done" and "in progress" over "progress"
+_PHRASES = "|".join(
+    r"\s+".join(re.escape(word) for word in phrase.split())
+    for phrase in sorted(STATUS_PHRASES, key=len, reverse=True)
+)
+
+# Full builds are redone this often, which also forgets deleted tickets
+MATCHER_TTL_SECONDS = 3600
+
+
+class TicketReference(NamedTuple):
+    key: str
+    field: str
+    # Status phrase attributed to this reference, if any
+    status: Optional[TicketStatus]
+
+
+class ProjectMatcher:
+    """
+    Finds a project's ticket keys and status phrases in one regex pass.
+
+    The compiled alternation only covers the project's key prefixes; matched
+    keys are then checked against the set of keys that exist, so the pattern
+    stays small however many tickets the project has and only needs
+    recompiling when a new prefix shows up.
+    """
+
+    def __init__(self, project_id: UUID):
+        self.project_id = project_id
+        self.keys: Set[str] = set()
+        self.seq = 0
+        self.pattern: Optional[re.Pattern] = None
+        self._prefixes: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def load(self, db: Session) -> "ProjectMatcher":
+        # Read the counter first: tickets created meanwhile are picked up by the next refresh
+        self.seq = db.scalar(select(Project.change_counter).where(Project.id == self.project_id)) or 0
+        self._add(db.scalars(select(Ticket.key).where(Ticket.project_id == self.project_id, Ticket.key.isnot(None))))
+        return self
+
+    def refresh(self, db: Session) -> "ProjectMatcher":
+        """
+        Add keys of tickets written since the last load/refresh, read from the
+        change log. Updates count too: a ticket moved into the project gets a
+        new key there but is logged as updated. Tickets that are gone, or have
+        moved out, join no row and add nothing.
+        """
+        rows = db.execute(
+            select(TicketChange.seq, Ticket.key)
+            .outerjoin(Ticket, and_(Ticket.id == TicketChange.ticket_id, Ticket.project_id == self.project_id))
+            .where(
+                TicketChange.project_id == self.project_id,
+                TicketChange.seq > self.seq,
+            )
+        ).all()
+        if rows:
+            with self._lock:
+                self.seq = max(self.seq, max(row.seq for row in rows))
+            self._add(row.key for row in rows if row.key)
+        return self
+
+    def _add(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            known_prefixes = len(self._prefixes)
+            for key in keys:
+                self.keys.add(key.upper())
+                self._prefixes.add(key.rsplit("-", 1)[0].upper())
+            if self.pattern is not None and len(self._prefixes) == known_prefixes:
+                return
+            prefixes = "|".join(re.escape(p) for p in sorted(self._prefixes, key=len, reverse=True))
+            key_pattern = rf"(?P<key>\b(?:{prefixes})-\d+\b)|" if prefixes else ""
+            self.pattern = re.compile(
+                rf"{key_pattern}(?P<phrase>\b(?:{_PHRASES})\b)|(?P<sep>[.;!?\n]+)",
+                re.IGNORECASE,
+            )
+
+    def find(self, field: str, text: Optional[str]) -> List[TicketReference]:
+        """
+        References to known tickets in `text`. Within each sentence a key takes
+        the nearest status phrase, so "finished TICK-1 and started TICK-2"
+        attributes one status to each ticket.
+        """
+        references: List[TicketReference] = []
+        if not text or self.pattern is None:
+            return references
+
+        keys, phrases = [], []
+
+        def close_clause():
+            for key, start, end in keys:
+                status = None
+                if phrases:
+                    status = min(phrases, key=lambda p: max(p[1] - end, start - p[2], 0))[0]
+                references.append(TicketReference(key, field, status))
+            keys.clear()
+            phrases.clear()
+
+        for match in self.pattern.finditer(text):
+            if match.lastgroup == "key":
+                key = match.group().upper()
+                if key in self.keys:
+                    keys.append((key, match.start(), match.end()))
+            elif match.lastgroup == "phrase":
+                phrase = " ".join(match.group().lower().split())
+                phrases.append((STATUS_PHRASES[phrase], match.start(), match.end()))
+            else:
+                close_clause()
+        close_clause()
+        return references
+
+
+class TicketMatcherCache:
+    def __init__(self):
+        self._matchers = TTLCache(MATCHER_TTL_SECONDS, max_entries=1000)
+        self._lock = threading.Lock()
+
+    def for_project(self, db: Session, project_id: UUID) -> ProjectMatcher:
+        """The project's matcher, built on first use and brought up to date with the change log."""
+        matcher = self._matchers.get(project_id)
+        if matcher is not None:
+            return matcher.refresh(db)
+        with self._lock:
+            matcher = self._matchers.get(project_id)
+            if matcher is None:
+                matcher = self._matchers.set(project_id, ProjectMatcher(project_id).load(db))
+                logger.info(f"Built ticket matcher for project {project_id} with {len(matcher.keys)} keys")
+                return matcher
+        return matcher.refresh(db)
+
+    def clear(self) -> None:
+        self._matchers.clear()
+
+ticket_matcher = TicketMatcherCache()
@@ -0,0 +1,188 @@
+import re
+import logging
+from uuid import UUID
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import case, func, insert, inspect, literal, or_, select, tuple_, update
+from sqlalchemy.orm import Session, aliased
+from app.models.project import Project, Ticket, TicketChange, TicketChangeOp, TicketStatus
+from app.schemas.project import Ticket as TicketSchema
+from app.services.realtime_service import realtime_service
+
+logger = logging.getLogger(__name__)
+
+
+class TicketService:
+    def derive_project_key(self, name: str) -> str:
+        """Key prefix from a project name: initials for multi-word names, else the first letters."""
+        words = re.findall(r'[A-Za-z0-9]+', name or "")
+        if len(words) > 1:
+            key = "".join(w[0] for w in words)[:4]
+        else:
+            key = (words[0] if words else "")[:4]
+        key = key.upper()
+        if not key or not key[0].isalpha():
+            key = "P" + key
+        return key[:10]
+
+    def allocate_keys(self, db: Session, project_id: UUID, count: int = 1) -> List[Tuple[int, str]]:
+        """
+        Reserve `count` consecutive ticket numbers for a project.
+        The counter is bumped with a single UPDATE ... RETURNING, so concurrent
+        creators serialize on the project row and never hand out the same number.
+        """
+        row = db.execute(
+            update(Project)
+            .where(Project.id == project_id)
+            # Keep updated_at as is: handing out ticket numbers isn't a project edit
+            .values(ticket_counter=Project.ticket_counter + count, updated_at=Project.updated_at)
+            .returning(Project.key, Project.ticket_counter)
+        ).first()
+        if row is None:
+            raise ValueError("Project not found")
+        key, last = row
+        return [(number, f"{key}-{number}") for number in range(last - count + 1, last + 1)]
+
+    def lock_projects(self, db: Session, project_ids: Iterable[Optional[UUID]]) -> None:
+        """
+        Lock project rows for the rest of the transaction, in id order.
+        Writers that need several projects (keys in one, change log in another)
+        take them all here first: locking them one at a time as each is needed
+        can deadlock two transactions that need the same projects.
+        """
+        ids = sorted({project_id for project_id in project_ids if project_id is not None})
+        if ids:
+            db.execute(select(Project.id).where(Project.id.in_(ids)).order_by(Project.id).with_for_update())
+
+    def assign_key(self, db: Session, ticket: Ticket) -> Ticket:
+        ((ticket.number, ticket.key),) = self.allocate_keys(db, ticket.project_id)
+        return ticket
+
+    def set_statuses(self, db: Session, project_id: UUID, statuses: Dict[str, TicketStatus]) -> List[Ticket]:
+        """
+        Move tickets, by key, to new statuses in a single UPDATE ... RETURNING.
+        Tickets already in their target status are left alone; returns the ones
+        that changed. The caller records the changes and commits.
+        """
+        if not statuses:
+            return []
+        target = case(
+            {key: literal(status, Ticket.status.type) for key, status in statuses.items()},
+            value=Ticket.key,
+        )
+        return db.scalars(
+            update(Ticket)
+            .where(
+                Ticket.project_id == project_id,
+                Ticket.key.in_(statuses),
+                Ticket.status.is_distinct_from(target),
+            )
+            .values(status=target, updated_at=datetime.utcnow())
+            .returning(Ticket)
+            .execution_options(synchronize_session=False)
+        ).all()
+
+    def board_query(
+        self,
+        project_id: UUID,
+        sprint_id: Optional[UUID],
+        status: Optional[TicketStatus],
+        after: Optional[Tuple[datetime, UUID]],
+        limit: int,
+    ):
+        """
+        One page of every board column in a single statement.
+
+        Window functions over the project's tickets give each status column its
+        total count and points, and number the tickets past `after` so at most
+        limit + 1 per column come back (the extra one only signals another page).
+        The first ticket of each column is always returned so its totals arrive
+        even when the page itself is empty; rows with in_page = 0 are not shown.
+        Yields (ticket, count, points, in_page) ordered by status, created_at, id.
+        """
+        in_page = case((tuple_(Ticket.created_at, Ticket.id) > tuple_(*after), 1), else_=0) if after else literal(1)
+        by_status = dict(partition_by=Ticket.status)
+        column_order = dict(by_status, order_by=(Ticket.created_at, Ticket.id))
+        ranked = select(
+            Ticket,
+            in_page.label("in_page"),
+            func.sum(in_page).over(**column_order, rows=(None, 0)).label("position"),
+            func.row_number().over(**column_order).label("column_row"),
+            func.count().over(**by_status).label("column_count"),
+            func.coalesce(func.sum(Ticket.points).over(**by_status), 0).label("column_points"),
+        ).where(Ticket.project_id == project_id)
+        if sprint_id:
+            ranked = ranked.where(Ticket.sprint_id == sprint_id)
+        if status:
+            ranked = ranked.where(Ticket.status == status)
+        ranked = ranked.subquery("ranked")
+
+        board_ticket = aliased(Ticket, ranked)
+        return select(
+            board_ticket, ranked.c.column_count, ranked.c.column_points, ranked.c.in_page
+        ).where(
+            or_((ranked.c.in_page == 1) & (ranked.c.position <= limit + 1), ranked.c.column_row == 1)
+        ).order_by(ranked.c.status, ranked.c.created_at, ranked.c.id)
+
+    def record_changes(
+        self,
+        db: Session,
+        changes: Iterable[Tuple[TicketChangeOp, Ticket]],
+        moved_from: Optional[Dict[UUID, UUID]] = None,
+    ) -> None:
+        """
+        Append ticket writes to the change log in the caller's transaction.
+        Sequence numbers come from the project row, which stays locked until
+        commit, so a project's changes become visible in seq order and a
+        client polling `since` a seq can't skip one that commits late.
+
+        A ticket updated into another project is also logged as deleted from
+        the one it left. The previous project is read from the ticket's pending
+        attribute history; bulk updates, which have none, pass `moved_from`
+        (ticket id -> previous project id) instead.
+        """
+        changes = list(changes)
+        if not changes:
+            return
+        moved_from = dict(moved_from or {})
+        for op, ticket in changes:
+            if op == TicketChangeOp.UPDATED:
+                # Read before the flush below clears the history
+                previous = inspect(ticket).attrs.project_id.history.deleted
+                if previous and previous[0] is not None:
+                    moved_from[ticket.id] = previous[0]
+        # Flush first so new tickets have ids and onupdate timestamps are set
+        db.flush()
+        by_project: Dict[UUID, list] = {}
+        for op, ticket in changes:
+            by_project.setdefault(ticket.project_id, []).append((op, ticket))
+            previous = moved_from.get(ticket.id) if op == TicketChangeOp.UPDATED else None
+            if previous is not None and previous != ticket.project_id:
+                by_project.setdefault(previous, []).append((TicketChangeOp.DELETED, ticket))
+
+        rows = []
+        # Lock projects in a stable order so concurrent batches can't deadlock
+        for project_id in sorted(by_project):
+            project_changes = by_project[project_id]
+            last = db.execute(
+                update(Project)
+                .where(Project.id == project_id)
+                .values(change_counter=Project.change_counter + len(project_changes), updated_at=Project.updated_at)
+                .returning(Project.change_counter)
+            ).scalar_one()
+            for seq, (op, ticket) in enumerate(project_changes, start=last - len(project_changes) + 1):
+                rows.append({
+                    "project_id": project_id,
+                    "seq": seq,
+                    "ticket_id": ticket.id,
+                    "op": op,
+                    "data": None if op == TicketChangeOp.DELETED else jsonable_encoder(TicketSchema.from_orm(ticket)),
+                })
+        db.execute(insert(TicketChange), rows)
+        for row in rows:
+            realtime_service.publish(db, row["project_id"], {
+                "type": "ticket", "op": row["op"], "id": row["ticket_id"], "seq": row["seq"], "data": row["data"],
+            })
+
+ticket_service = TicketService()
@@ -0,0 +1,45 @@
+"""
+Background worker: runs the scheduler's jobs and the durable response queue
+outside the API processes.
+
+    python -m app.worker
+
+Run API processes with RUN_SCHEDULER_IN_APP=false so they leave this work to
+the worker. Several workers can run at once: only the elected leader runs the
+scheduled jobs, and database-mode response jobs are claimed with SKIP LOCKED.
+"""
+import logging
+import signal
+import threading
+
+from app.core.config import settings
+# Register every model with the mapper; the API gets these through its routes
+from app.models import ai_agent, project, settings as settings_models, standup, user  # noqa: F401
+from app.services.response_queue import response_queue
+from app.services.scheduler import start_scheduler, stop_scheduler
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda signum, frame: stop.set())
+
+    start_scheduler()
+    if response_queue.durable:
+        response_queue.start()
+    else:
+        # The in-memory queue only holds responses submitted to its own process
+        logger.info("RESPONSE_QUEUE_MODE is memory; API processes handle standup responses themselves.")
+    logger.info(f"{settings.PROJECT_NAME} worker started.")
+
+    stop.wait()
+
+    logger.info(f"{settings.PROJECT_NAME} worker stopping.")
+    response_queue.stop()
+    stop_scheduler()
+
+
+if __name__ == "__main__":
+    main()
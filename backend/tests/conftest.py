@@ -0,0 +1,33 @@
+import os
+import tempfile
+
+# The app binds its engines to SQLALCHEMY_DATABASE_URI at import time. Tests always get a
+# throwaway SQLite file so they can never touch a real database.
+os.environ["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'tickora-test.db')}"
+os.environ.pop("SQLALCHEMY_REPLICA_URI", None)
+os.environ.setdefault("RESPONSE_QUEUE_MODE", "memory")
+
+import pytest
+
+from app.db.base import Base
+from app.models import ai_agent, project, settings, standup, user  # noqa: F401,E402
+
+
+@pytest.fixture(scope="session")
+def engine():
+    from app.database import engine
+
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def db(engine):
+    from app.database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
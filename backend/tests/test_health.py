@@ -0,0 +1,30 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import deps
+from app.main import app
+
+DIAGNOSTICS = ["/api/v1/health/db", "/api/v1/health/coalescing", "/api/v1/health/scheduler"]
+
+
+@pytest.fixture
+def client():
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_health_is_open(client):
+    assert client.get("/api/v1/health").json() == {"status": "ok"}
+
+
+@pytest.mark.parametrize("path", DIAGNOSTICS)
+def test_diagnostics_need_a_superuser(client, path):
+    assert client.get(path).status_code == 401
+
+    app.dependency_overrides[deps.get_current_active_user] = lambda: SimpleNamespace(is_active=True, is_superuser=False)
+    assert client.get(path).status_code == 403
+
+    app.dependency_overrides[deps.get_current_active_user] = lambda: SimpleNamespace(is_active=True, is_superuser=True)
+    assert client.get(path).status_code == 200
@@ -0,0 +1,44 @@
+import uuid
+
+from app.core.principal_cache import principal_cache
+from app.models.user import User
+
+
+def test_user_writes_invalidate_on_commit_not_flush(db):
+    email = f"principal-{uuid.uuid4().hex[:8]}@example.com"
+    user = User(email=email, hashed_password="x", full_name="P", is_active=True)
+    db.add(user)
+    db.commit()
+    principal_cache.set(email, user)
+
+    user.is_active = False
+    db.flush()
+    # Another request could still read the committed row now; re-caching it is harmless
+    assert principal_cache.get(email) is not None
+    db.commit()
+    assert principal_cache.get(email) is None
+
+
+def test_renamed_user_drops_the_old_email(db):
+    old, new = (f"{name}-{uuid.uuid4().hex[:8]}@example.com" for name in ("old", "new"))
+    user = User(email=old, hashed_password="x", full_name="R", is_active=True)
+    db.add(user)
+    db.commit()
+    principal_cache.set(old, user)
+
+    user.email = new
+    db.commit()
+    assert principal_cache.get(old) is None
+
+
+def test_rolled_back_writes_keep_the_entry(db):
+    email = f"rollback-{uuid.uuid4().hex[:8]}@example.com"
+    user = User(email=email, hashed_password="x", full_name="B", is_active=True)
+    db.add(user)
+    db.commit()
+    principal_cache.set(email, user)
+
+    user.is_active = False
+    db.flush()
+    db.rollback()
+    assert principal_cache.get(email) is not None
@@ -0,0 +1,122 @@
+"""
+The hot queries from routes/ and services/ must be answered from an index.
+
+Plans are checked on SQLite against the model-declared schema. Set
+TEST_POSTGRES_URL to also check them on Postgres (run in a throwaway schema,
+with sequential scans disabled so the tiny test tables don't tip the planner).
+"""
+import os
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, event, select, text
+
+from app.db.base import Base
+from app.models.ai_agent import Epic
+from app.models.project import Project, ProjectMember, Sprint, SprintStatus, Ticket, TicketChange, TicketStatus
+from app.models.standup import (
+    JobStatus, ResponseJob, SessionStatus, StandupConfig, StandupResponse, StandupSession, StandupSummary,
+)
+
+ID = uuid.uuid4()
+NOW = datetime(2026, 1, 1)
+
+# (name, table that must be searched by index, statement)
+HOT_QUERIES = [
+    ("tickets by project, paginated", "tickets",
+     select(Ticket).where(Ticket.project_id == ID).order_by(Ticket.created_at, Ticket.id).limit(100)),
+    ("tickets by project and status", "tickets",
+     select(Ticket).where(Ticket.project_id == ID, Ticket.status == TicketStatus.DONE)),
+    ("tickets by key", "tickets",
+     select(Ticket).where(Ticket.project_id == ID, Ticket.key.in_(["P-1", "P-2"]))),
+    ("tickets by sprint", "tickets",
+     select(Ticket).where(Ticket.sprint_id == ID)),
+    ("ticket change feed", "ticket_changes",
+     select(TicketChange).where(TicketChange.project_id == ID, TicketChange.seq > 10).order_by(TicketChange.seq)),
+    ("sprints by project and status", "sprints",
+     select(Sprint).where(Sprint.project_id == ID, Sprint.status == SprintStatus.ACTIVE)),
+    ("projects by owner", "projects",
+     select(Project).where(Project.owner_id == ID)),
+    ("project membership", "project_members",
+     select(ProjectMember).where(ProjectMember.project_id == ID, ProjectMember.user_id == ID)),
+    ("active standup session", "standup_sessions",
+     select(StandupSession).where(StandupSession.project_id == ID, StandupSession.status == SessionStatus.ACTIVE)),
+    ("session for a config's fire time", "standup_sessions",
+     select(StandupSession).where(StandupSession.config_id == ID, StandupSession.started_at == NOW)),
+    ("expired sessions", "standup_sessions",
+     select(StandupSession.id).where(StandupSession.status == SessionStatus.ACTIVE, StandupSession.ends_at < NOW)),
+    ("due standup configs", "standup_configs",
+     select(StandupConfig).where(StandupConfig.is_active == True, StandupConfig.next_fire_at <= NOW)),
+    ("response of a user", "standup_responses",
+     select(StandupResponse).where(StandupResponse.session_id == ID, StandupResponse.user_id == ID)),
+    ("summary of a session", "standup_summaries",
+     select(StandupSummary).where(StandupSummary.session_id == ID)),
+    ("due response jobs", "response_jobs",
+     select(ResponseJob.id).where(ResponseJob.status == JobStatus.QUEUED, ResponseJob.run_after <= NOW)),
+    ("epics by project", "ai_epics",
+     select(Epic).where(Epic.project_id == ID)),
+]
+
+
+def _capture_plans(engine, explain_prefix):
+    """Run EXPLAIN on the same cursor before each statement and keep the plan lines."""
+    plans = []
+
+    def explain(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            cursor.execute(explain_prefix + statement, parameters)
+            plans.append([" ".join(str(col) for col in row) for row in cursor.fetchall()])
+
+    event.listen(engine, "before_cursor_execute", explain)
+    return plans, lambda: event.remove(engine, "before_cursor_execute", explain)
+
+
+def _uses_index(plan, table, backend):
+    if backend == "sqlite":
+        # e.g. "SEARCH tickets USING INDEX ix_tickets_project_id_status (project_id=? AND status=?)";
+        # "SCAN tickets [USING INDEX ...]" reads the whole table
+        lines = [line for line in plan if f" {table} " in f" {line} "]
+        return bool(lines) and all(" SEARCH " in f" {line} " and "USING" in line for line in lines)
+    return not any(f"Seq Scan on {table}" in line for line in plan)
+
+
+@pytest.fixture(scope="module", params=["sqlite", "postgresql"])
+def explain_conn(request, engine):
+    if request.param == "sqlite":
+        plans, stop = _capture_plans(engine, "EXPLAIN QUERY PLAN ")
+        try:
+            with engine.connect() as conn:
+                yield "sqlite", conn, plans
+        finally:
+            stop()
+        return
+
+    url = os.getenv("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL not set")
+    pg_engine = create_engine(url)
+    schema = f"test_indexes_{uuid.uuid4().hex[:8]}"
+    with pg_engine.connect() as conn:
+        conn.execute(text(f"CREATE SCHEMA {schema}"))
+        conn.execute(text(f"SET search_path TO {schema}"))
+        Base.metadata.create_all(conn)
+        conn.execute(text("SET enable_seqscan = off"))
+        plans, stop = _capture_plans(pg_engine, "EXPLAIN ")
+        try:
+            yield "postgresql", conn, plans
+        finally:
+            stop()
+            conn.rollback()
+            conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+            conn.commit()
+    pg_engine.dispose()
+
+
+@pytest.mark.parametrize("name,table,stmt", HOT_QUERIES, ids=[q[0] for q in HOT_QUERIES])
+def test_hot_query_uses_index(explain_conn, name, table, stmt):
+    backend, conn, plans = explain_conn
+    plans.clear()
+    conn.execute(stmt)
+    assert plans, "statement was not captured"
+    assert _uses_index(plans[0], table, backend), f"{name} does not use an index on {table}: {plans[0]}"
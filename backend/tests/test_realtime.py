@@ -0,0 +1,20 @@
+import json
+import uuid
+
+from app.services.metrics_service import metrics_service
+from app.services.realtime_service import CHANNEL, realtime_service
+
+
+def _notify(event):
+    realtime_service._on_notify(None, 0, CHANNEL, json.dumps(event))
+
+
+def test_notified_writes_invalidate_cached_metrics():
+    written, untouched = uuid.uuid4(), uuid.uuid4()
+    metrics_service.cache.set(written, {"tickets": 1})
+    metrics_service.cache.set(untouched, {"tickets": 2})
+
+    _notify({"type": "ticket", "op": "updated", "id": str(uuid.uuid4()), "project_id": str(written)})
+
+    assert metrics_service.cache.get(written) is None
+    assert metrics_service.cache.get(untouched) == {"tickets": 2}
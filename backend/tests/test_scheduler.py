@@ -0,0 +1,40 @@
+import threading
+
+from apscheduler.schedulers.background import BackgroundScheduler
+
+from app.services import scheduler as scheduler_module
+
+
+def test_stepping_down_waits_for_running_jobs(monkeypatch):
+    scheduler = BackgroundScheduler()
+    scheduler.start(paused=True)
+    monkeypatch.setattr(scheduler_module, "scheduler", scheduler)
+    started, release = threading.Event(), threading.Event()
+
+    @scheduler_module._leader_job
+    def job():
+        started.set()
+        release.wait(5)
+
+    try:
+        scheduler_module._resume_jobs()
+        threading.Thread(target=job).start()
+        assert started.wait(5)
+
+        pausing = threading.Thread(target=scheduler_module._pause_jobs)
+        pausing.start()
+        pausing.join(0.2)
+        assert pausing.is_alive(), "stepped down while a job was still running"
+
+        release.set()
+        pausing.join(5)
+        assert not pausing.is_alive()
+
+        # A run the executor picks up after stepping down is skipped
+        started.clear()
+        job()
+        assert not started.is_set()
+    finally:
+        release.set()
+        scheduler_module._pause_jobs()
+        scheduler.shutdown()
@@ -0,0 +1,77 @@
+"""
+Standup fire times are worked out in the config's timezone, so they follow DST.
+"""
+from datetime import datetime
+from uuid import uuid4
+
+from app.models.project import Project
+from app.models.standup import NEVER_FIRES, StandupConfig
+from app.models.user import User
+from app.services.scheduler import create_daily_sessions
+from app.services.standup_service import standup_service
+
+EVERY_DAY = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+
+def _config(time, timezone="UTC", working_days=EVERY_DAY):
+    return StandupConfig(time=time, timezone=timezone, working_days=working_days)
+
+
+def test_time_skipped_by_spring_forward_fires_an_hour_later():
+    # New York skips 02:00-03:00 on Sunday 2026-03-08
+    config = _config("02:30", "America/New_York")
+    # 03:30 EDT
+    assert standup_service.next_fire_time(config, datetime(2026, 3, 8, 0, 0)) == datetime(2026, 3, 8, 7, 30)
+
+
+def test_time_repeated_by_fall_back_fires_once():
+    # New York repeats 01:00-02:00 on Sunday 2026-11-01
+    config = _config("01:30", "America/New_York")
+    first = standup_service.next_fire_time(config, datetime(2026, 11, 1, 0, 0))
+    # 01:30 EDT, the first of the two
+    assert first == datetime(2026, 11, 1, 5, 30)
+    # Not again at 01:30 EST an hour later, but the next day
+    assert standup_service.next_fire_time(config, first) == datetime(2026, 11, 2, 6, 30)
+
+
+def test_same_local_time_either_side_of_dst():
+    config = _config("09:00", "Europe/Berlin")
+    # CEST is UTC+2 until 2026-10-25, then CET is UTC+1
+    assert standup_service.next_fire_time(config, datetime(2026, 10, 23, 8, 0)) == datetime(2026, 10, 24, 7, 0)
+    assert standup_service.next_fire_time(config, datetime(2026, 10, 24, 7, 0)) == datetime(2026, 10, 25, 8, 0)
+
+
+def test_non_working_days_are_skipped():
+    config = _config("09:00", working_days=["Mon", "Tue", "Wed", "Thu", "Fri"])
+    # Friday's standup done: next is Monday
+    assert standup_service.next_fire_time(config, datetime(2026, 10, 16, 9, 0)) == datetime(2026, 10, 19, 9, 0)
+    # Working days are the config's local days, not UTC ones: Monday 08:00 in
+    # Tokyo is still Sunday in UTC
+    tokyo = _config("08:00", "Asia/Tokyo", working_days=["Mon"])
+    assert standup_service.next_fire_time(tokyo, datetime(2026, 10, 17, 0, 0)) == datetime(2026, 10, 18, 23, 0)
+
+
+def test_config_that_can_never_fire():
+    assert standup_service.next_fire_time(_config("09:00", working_days=[]), datetime(2026, 1, 1)) is None
+    assert standup_service.next_fire_time(_config("9am"), datetime(2026, 1, 1)) is None
+    config = _config("09:00", working_days=[])
+    assert standup_service.schedule(config, datetime(2026, 1, 1)) == NEVER_FIRES
+
+
+def test_scheduler_marks_configs_that_can_never_fire(db):
+    owner = User(email=f"schedule-{uuid4().hex[:8]}@example.com", hashed_password="x", full_name="S")
+    db.add(owner)
+    db.flush()
+    project = Project(name="Schedule", key="SCH", owner_id=owner.id)
+    db.add(project)
+    db.flush()
+    config = StandupConfig(project_id=project.id, time="09:00", working_days=[], is_active=True)
+    db.add(config)
+    db.commit()
+
+    # The job body itself: the wrapper only runs it on the elected leader
+    create_daily_sessions.__wrapped__()
+
+    db.refresh(config)
+    # Scheduled for good, so the next tick's "not scheduled yet" scan skips it
+    assert config.next_fire_at == NEVER_FIRES
@@ -0,0 +1,96 @@
+"""
+Summary generation must run a fixed number of queries however big the team
+is, and a hung AI call must not hold up other teams' summaries.
+"""
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models.project import Project, ProjectMember
+from app.models.standup import StandupResponse, StandupSession
+from app.models.user import User
+from app.services.ai_service import ai_service
+from app.services.standup_service import standup_service
+
+
+def _session_with_team(db, size):
+    """A standup session in a fresh project with `size` members, half of whom responded."""
+    tag = uuid.uuid4().hex[:8]
+    owner = User(email=f"owner-{tag}@example.com", hashed_password="x", full_name="Owner")
+    db.add(owner)
+    db.flush()
+    project = Project(name=f"Team {tag}", key="TEAM", owner_id=owner.id)
+    members = [User(email=f"m{i}-{tag}@example.com", hashed_password="x", full_name=f"M{i}") for i in range(size)]
+    db.add_all([project, *members])
+    db.flush()
+    session = StandupSession(project_id=project.id, ends_at=datetime.utcnow() + timedelta(hours=2))
+    db.add_all([ProjectMember(project_id=project.id, user_id=m.id) for m in members])
+    db.add(session)
+    db.flush()
+    db.add_all([
+        StandupResponse(session_id=session.id, user_id=m.id, yesterday="y", today="t", blockers="none")
+        for m in members[: size // 2]
+    ])
+    db.commit()
+    return session.id
+
+
+def _count_statements(engine, session_id):
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    db = SessionLocal()
+    try:
+        summary = standup_service.generate_standup_summary(db, session_id)
+        text = summary.summary_text
+    finally:
+        db.close()
+        event.remove(engine, "before_cursor_execute", count)
+    return len(statements), text
+
+
+@pytest.fixture(autouse=True)
+def fake_ai(monkeypatch):
+    monkeypatch.setattr(ai_service, "generate_summary", lambda prompt: {"summary_text": "S", "blockers_json": []})
+
+
+def test_summary_query_count_does_not_grow_with_team(engine, db):
+    small, small_text = _count_statements(engine, _session_with_team(db, 5))
+    large, large_text = _count_statements(engine, _session_with_team(db, 50))
+
+    assert small == large
+    # Everyone who didn't respond is listed, the owner included
+    assert small_text.count("\n- ") == 5 - 5 // 2 + 1
+    assert large_text.count("\n- ") == 50 - 50 // 2 + 1
+
+
+def test_hung_ai_calls_do_not_hold_up_other_summaries(db, monkeypatch):
+    hang = threading.Event()
+
+    def hung(prompt):
+        hang.wait(10)
+        return {"summary_text": "late", "blockers_json": []}
+
+    monkeypatch.setattr(ai_service, "generate_summary", hung)
+    try:
+        # As many hung calls as there are summary workers
+        for _ in range(settings.STANDUP_SUMMARY_MAX_WORKERS):
+            session_id = _session_with_team(db, 2)
+            with SessionLocal() as worker_db, pytest.raises(TimeoutError):
+                standup_service.generate_standup_summary(worker_db, session_id, timeout=0.05)
+
+        monkeypatch.setattr(ai_service, "generate_summary", lambda prompt: {"summary_text": "S", "blockers_json": []})
+        session_id = _session_with_team(db, 2)
+        with SessionLocal() as worker_db:
+            summary = standup_service.generate_standup_summary(worker_db, session_id, timeout=1)
+            assert summary.summary_text.startswith("S")
+    finally:
+        hang.set()
@@ -0,0 +1,119 @@
+"""
+Standup responses are matched against ticket keys in one pass per field, and
+the statuses found are applied with a single UPDATE per project.
+"""
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.api import deps
+from app.database import SessionLocal
+from app.main import app
+from app.models.project import Project, Ticket, TicketStatus
+from app.models.standup import StandupResponse, StandupSession
+from app.models.user import User
+from app.services.standup_service import standup_service
+from app.services.ticket_matcher import ProjectMatcher, TicketReference, ticket_matcher
+
+
+@pytest.fixture
+def owner(db):
+    user = User(email=f"matcher-{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", full_name="Owner")
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def client(owner):
+    app.dependency_overrides[deps.get_current_active_user] = lambda: owner
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    ticket_matcher.clear()
+
+
+def _project(db, owner, key):
+    project = Project(name=f"{key} {uuid.uuid4().hex[:8]}", key=key, owner_id=owner.id)
+    db.add(project)
+    db.commit()
+    return project
+
+
+def _ticket(client, project, title="t"):
+    r = client.post("/api/v1/tickets", json={"title": title, "project_id": str(project.id)})
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def test_refresh_learns_keys_of_tickets_moved_in(db, owner, client):
+    one, two = _project(db, owner, "ONE"), _project(db, owner, "TWO")
+    _ticket(client, one)
+    moving = _ticket(client, two)
+    assert ticket_matcher.for_project(db, one.id).keys == {"ONE-1"}
+    assert ticket_matcher.for_project(db, two.id).keys == {"TWO-1"}
+
+    r = client.patch(f"/api/v1/tickets/{moving['id']}", json={"project_id": str(one.id)})
+    assert r.json()["key"] == "ONE-2"
+
+    matcher = ticket_matcher.for_project(db, one.id)
+    assert matcher.keys == {"ONE-1", "ONE-2"}
+    assert matcher.find("yesterday", "finished ONE-2") == [TicketReference("ONE-2", "yesterday", TicketStatus.DONE)]
+    # The project it left doesn't pick up its new key
+    assert "ONE-2" not in ticket_matcher.for_project(db, two.id).keys
+
+
+def test_find_attributes_the_nearest_phrase_in_each_sentence(db, owner, client):
+    project = _project(db, owner, "ATT")
+    for _ in range(3):
+        _ticket(client, project)
+    matcher = ProjectMatcher(project.id).load(db)
+
+    assert matcher.find("yesterday", "Finished ATT-1 and started att-2. ATT-3 is not done, ATT-9 was closed") == [
+        TicketReference("ATT-1", "yesterday", TicketStatus.DONE),
+        TicketReference("ATT-2", "yesterday", TicketStatus.IN_PROGRESS),
+        TicketReference("ATT-3", "yesterday", None),
+    ]
+
+
+def test_process_responses_applies_statuses_in_one_update(db, owner, client):
+    project = _project(db, owner, "RSP")
+    for _ in range(3):
+        _ticket(client, project)
+    session = StandupSession(project_id=project.id, ends_at=datetime.utcnow() + timedelta(hours=2))
+    teammate = User(email=f"teammate-{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", full_name="Mate")
+    db.add_all([session, teammate])
+    db.flush()
+    started = datetime.utcnow()
+    responses = [
+        # Only yesterday can mark a ticket done: "finished" today is a plan, not news
+        StandupResponse(session_id=session.id, user_id=owner.id, created_at=started,
+                        yesterday="Finished RSP-1", today="finished RSP-2, working on RSP-3", blockers="RSP-3 done"),
+        StandupResponse(session_id=session.id, user_id=teammate.id, created_at=started + timedelta(seconds=1),
+                        yesterday="RSP-3 is in review", today="", blockers=""),
+    ]
+    db.add_all(responses)
+    db.commit()
+
+    updates = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE tickets"):
+            updates.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    worker_db = SessionLocal()
+    try:
+        standup_service.process_responses(worker_db, [r.id for r in responses])
+        worker_db.commit()
+    finally:
+        worker_db.close()
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert len(updates) == 1
+    statuses = {t.key: t.status for t in db.query(Ticket).filter(Ticket.project_id == project.id).populate_existing()}
+    # The later response's mention of RSP-3 wins
+    assert statuses == {"RSP-1": TicketStatus.DONE, "RSP-2": TicketStatus.TODO, "RSP-3": TicketStatus.REVIEW}
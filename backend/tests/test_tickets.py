@@ -0,0 +1,124 @@
+"""
+Ticket writes against the real tickets schema, where search_vector is a
+column Postgres generates and rejects any value for.
+
+The Postgres test needs TEST_POSTGRES_URL. It builds search_vector with the
+migration itself rather than create_all, so it checks what production runs.
+"""
+import importlib.util
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from app.api import deps
+from app.db.base import Base
+from app.main import app
+from app.models.project import Project
+from app.models.user import User
+from app.services.ticket_service import ticket_service
+
+VERSIONS = Path(__file__).resolve().parents[1] / "alembic" / "versions"
+MIGRATION = VERSIONS / "6ccd427cc7c7_add_ticket_full_text_search.py"
+
+
+def _load_migration(path):
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    return migration
+
+
+def _owner_and_project(db):
+    tag = uuid.uuid4().hex[:8]
+    owner = User(email=f"tickets-{tag}@example.com", hashed_password="x", full_name="Owner")
+    db.add(owner)
+    db.flush()
+    project = Project(name=f"Tickets {tag}", key="TICK", owner_id=owner.id)
+    db.add(project)
+    db.commit()
+    return owner, project
+
+
+@pytest.fixture
+def client():
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_backfilled_project_keys_match_new_ones():
+    backfill = _load_migration(VERSIONS / "6fcce34b6ac1_add_per_project_ticket_keys.py")
+    for name in ["Tick Board", "Tickora", "my big bold new plan", "2024 roadmap", "42", "", "--", "ai/ml ops"]:
+        assert backfill._project_key(name) == ticket_service.derive_project_key(name), name
+
+
+def test_create_ticket_never_writes_search_vector(engine, db, client):
+    owner, project = _owner_and_project(db)
+    app.dependency_overrides[deps.get_current_active_user] = lambda: owner
+    inserts = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO tickets"):
+            inserts.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        r = client.post("/api/v1/tickets", json={"title": "Fix login", "project_id": str(project.id)})
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert r.status_code == 200, r.text
+    # Postgres may hand the generated value back (RETURNING) but must not be sent one
+    assert inserts and all("search_vector" not in statement.split("VALUES")[0] for statement in inserts)
+
+
+@pytest.fixture
+def postgres_session_factory():
+    url = os.getenv("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL not set")
+    from alembic.migration import MigrationContext
+    from alembic.operations import Operations
+
+    schema = f"test_tickets_{uuid.uuid4().hex[:8]}"
+    pg_engine = create_engine(url, connect_args={"options": f"-csearch_path={schema}"})
+    with pg_engine.connect() as conn:
+        conn.execute(text(f"CREATE SCHEMA {schema}"))
+        Base.metadata.create_all(conn)
+        # Replace the model's column with the one the migration creates
+        conn.execute(text("ALTER TABLE tickets DROP COLUMN search_vector"))
+        conn.commit()
+        with Operations.context(MigrationContext.configure(conn)):
+            _load_migration(MIGRATION).upgrade()
+        conn.commit()
+    try:
+        yield sessionmaker(bind=pg_engine, autoflush=False, expire_on_commit=False)
+    finally:
+        with pg_engine.connect() as conn:
+            conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+            conn.commit()
+        pg_engine.dispose()
+
+
+def test_create_ticket_on_postgres(postgres_session_factory, client):
+    with postgres_session_factory() as db:
+        owner, project = _owner_and_project(db)
+
+    def get_db():
+        with postgres_session_factory() as db:
+            yield db
+
+    app.dependency_overrides[deps.get_db] = get_db
+    app.dependency_overrides[deps.get_current_active_user] = lambda: owner
+    r = client.post("/api/v1/tickets", json={"title": "Fix login redirect", "project_id": str(project.id)})
+    assert r.status_code == 200, r.text
+
+    with postgres_session_factory() as db:
+        matched = db.execute(
+            text("SELECT key FROM tickets WHERE search_vector @@ plainto_tsquery('english', 'login')")
+        ).scalars().all()
+    assert matched == [r.json()["key"]]